@@ -1,15 +1,22 @@
+import atexit
+import functools
+import io
 import json
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
+import re
+import signal
 import sys
+import threading
 import time
 from subprocess import Popen, PIPE
-from typing import List, Optional
+from typing import BinaryIO, List, Optional, Tuple
 
 import kafka
 import kazoo.client
-from py4j.java_gateway import OutputConsumer, ProcessConsumer
+from py4j.java_gateway import ProcessConsumer
 from py4j.clientserver import ClientServer, JavaParameters
 from pythonjsonlogger.jsonlogger import JsonFormatter
 
@@ -21,7 +28,7 @@ from openeo_driver.util.http import requests_with_retry
 from openeo_driver.util.logging import JSON_LOGGER_DEFAULT_FORMAT
 from openeogeotrellis import sentinel_hub
 from openeogeotrellis.backend import GpsBatchJobs
-from openeogeotrellis.configparams import ConfigParams
+from openeogeotrellis.configparams import get_config_params
 from openeogeotrellis.layercatalog import get_layer_catalog
 from openeogeotrellis.vault import Vault
 from openeogeotrellis.job_registry import ZkJobRegistry
@@ -34,13 +41,17 @@ ARG_USER_ID = 'user_id'
 # TODO: include job_id in log statements not issued by our own code e.g. Py4J  # 141
 _log = logging.getLogger(__name__)
 
-DEPENDENCIES_POLL_INTERVAL_S = 60  # poll every x seconds
+DEPENDENCIES_MIN_POLL_INTERVAL_S = 15  # initial poll interval, also used after a dependency status change
+DEPENDENCIES_MAX_POLL_INTERVAL_S = 60 * 5  # poll interval grows exponentially up to this value
+DEPENDENCIES_POLL_INTERVAL_BACKOFF_FACTOR = 1.5
 DEPENDENCIES_MAX_POLL_DELAY_S = 60 * 60 * 24 * 7  # for a maximum delay of y seconds
 
 TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES = 'delete_batch_process_dependency_sources'
 TASK_POLL_SENTINELHUB_BATCH_PROCESSES = 'poll_sentinelhub_batch_processes'  # TODO: deprecated, remove this eventually
 TASK_AWAIT_DEPENDENCIES = 'await_dependencies'
 
+_SENSITIVE_PROPERTY_RE = re.compile(r"secret|token", re.IGNORECASE)
+
 
 def schedule_delete_batch_process_dependency_sources(batch_job_id: str, user_id: str, dependency_sources: List[str]):
     _schedule_task(task_id=TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES,
@@ -68,44 +79,81 @@ def _schedule_task(task_id: str, arguments: dict, job_id: str, user_id: str):
         'arguments': arguments
     }
 
-    config = ConfigParams()
+    config = get_config_params()
     env = config.async_task_handler_environment
 
-    def encode(s: str) -> bytes:
-        return s.encode('utf-8')
+    log = logging.LoggerAdapter(_log, extra={'job_id': job_id, 'user_id': user_id})
+    redacted_task_str = _redacted_json(task)
 
-    producer = kafka.KafkaProducer(
-        bootstrap_servers=config.async_tasks_kafka_bootstrap_servers,
-        security_protocol='PLAINTEXT',
-        acks='all'
-    )
+    log.debug("scheduling task %s on env %s...", redacted_task_str, env)
+    _get_producer().send(topic="openeo-async-tasks",
+                         value=task,
+                         headers=_env_headers(env) if env else None).get(timeout=120)
+    log.info("scheduled task %s on env %s", redacted_task_str, env)
 
-    try:
-        log = logging.LoggerAdapter(_log, extra={'job_id': job_id, 'user_id': user_id})
-        redacted_task_str = json.dumps(_redact(task))
 
-        log.debug(f"scheduling task {redacted_task_str} on env {env}...")
-        producer.send(topic="openeo-async-tasks",
-                      value=encode(json.dumps(task)),
-                      headers=[('env', encode(env))] if env else None).get(timeout=120)
-        log.info(f"scheduled task {redacted_task_str} on env {env}")
-    finally:
-        producer.close()
+@functools.lru_cache
+def _env_headers(env: str) -> List[Tuple[str, bytes]]:
+    return [('env', env.encode('utf-8'))]
+
+
+_producer: Optional[kafka.KafkaProducer] = None
+_producer_lock = threading.Lock()
+
+
+def _get_producer() -> kafka.KafkaProducer:
+    """Lazily create a KafkaProducer that is shared by all scheduling calls in this process."""
+    global _producer
+
+    if _producer is None:
+        with _producer_lock:
+            if _producer is None:
+                _producer = kafka.KafkaProducer(
+                    bootstrap_servers=get_config_params().async_tasks_kafka_bootstrap_servers,
+                    security_protocol='PLAINTEXT',
+                    value_serializer=lambda task: json.dumps(task, separators=(",", ":")).encode('utf-8'),
+                    acks='all',
+                    # allow concurrent scheduling calls to share a ProduceRequest
+                    linger_ms=100,
+                    batch_size=64 * 1024,
+                    compression_type='gzip',
+                    max_in_flight_requests_per_connection=5,
+                )
+                atexit.register(_close_producer)
+
+    return _producer
+
+
+def _close_producer():
+    global _producer
+
+    with _producer_lock:
+        if _producer is not None:
+            _producer.flush()
+            _producer.close()
+            _producer = None
 
 
 def _redact(task: dict) -> dict:
-    def redact(prop: Optional[str], value):
-        sensitive = isinstance(prop, str) and any(sensitive_value in prop.lower()
-                                                  for sensitive_value in ["secret", "token"])
+    redacted = {}
+    stack = [(task, redacted)]
+
+    while stack:
+        src, dst = stack.pop()
+        for prop, value in src.items():
+            if isinstance(prop, str) and _SENSITIVE_PROPERTY_RE.search(prop):
+                dst[prop] = "(redacted)"
+            elif isinstance(value, dict):
+                dst[prop] = {}
+                stack.append((value, dst[prop]))
+            else:
+                dst[prop] = value
+
+    return redacted
 
-        if sensitive:
-            return "(redacted)"
-        elif isinstance(value, dict):
-            return {prop: redact(prop, value) for prop, value in value.items()}
-        else:
-            return value
 
-    return redact(None, task)
+def _redacted_json(task: dict) -> str:
+    return json.dumps(_redact(task), separators=(",", ":"))
 
 
 def launch_client_server(jarpath, redirect_stdout, redirect_stderr, classpath, javaopts) -> ClientServer:
@@ -118,38 +166,197 @@ def launch_client_server(jarpath, redirect_stdout, redirect_stderr, classpath, j
 
     stderr = redirect_stderr
 
-    proc = Popen(command, stdout=PIPE, stdin=PIPE, stderr=stderr)
+    # unbuffered: reading the port must not consume any output beyond the first line
+    # Note: stdin pipe is kept deliberately (as in launch_gateway): its EOF is how the JVM can notice we're gone.
+    proc = Popen(command, stdout=PIPE, stdin=PIPE, stderr=stderr, bufsize=0, close_fds=True,
+                 start_new_session=True)
+    atexit.register(_terminate_process_group, proc)
 
     _port = int(proc.stdout.readline())
 
-    OutputConsumer(redirect_stdout, proc.stdout, daemon=daemonize_redirect).start()
+    threading.Thread(target=_relay_output, args=(proc.stdout, redirect_stdout.buffer),
+                     daemon=daemonize_redirect).start()
     ProcessConsumer(proc, [redirect_stdout], daemon=daemonize_redirect).start()
 
     return ClientServer(JavaParameters(port=_port, eager_load=True))
 
 
+def _terminate_process_group(proc: Popen):
+    if proc.poll() is None:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _relay_output(source: BinaryIO, target: BinaryIO):
+    """
+    Copy (JVM) output line by line, without decoding it: whole lines keep it from interleaving mid-line
+    with the JSON log records that are written to the same stream.
+    """
+    # Buffer the raw (unbuffered) pipe, otherwise readline() reads byte per byte.
+    for line in iter(io.BufferedReader(source).readline, b""):
+        target.write(line)
+        target.flush()
+
+
+def _dependency_sources(arguments: dict) -> List[str]:
+    return (arguments.get('dependency_sources')
+            or [f"s3://{sentinel_hub.OG_BATCH_RESULTS_BUCKET}/{subfolder}" for subfolder in arguments['subfolders']])
+
+
+def _requires_jvm(task_id: str, arguments: dict) -> bool:
+    if task_id == TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES:
+        # only S3 sources are deleted through the JVM, assembled folders on disk are removed from Python
+        return any(not source.startswith("file:") for source in _dependency_sources(arguments))
+
+    return True
+
+
+def _get_batch_jobs(java_gateway: Optional[ClientServer], batch_job_id: str, user_id: str, principal: str,
+                    keytab: str, sentinel_hub_credentials: bool = True) -> GpsBatchJobs:
+    vault = Vault(get_config_params().vault_addr)
+    catalog = get_layer_catalog(vault=vault)
+
+    jvm = java_gateway.jvm if java_gateway else None
+    if jvm:
+        jvm.org.slf4j.MDC.put(jvm.org.openeo.logging.JsonLayout.UserId(), user_id)
+        jvm.org.slf4j.MDC.put(jvm.org.openeo.logging.JsonLayout.JobId(), batch_job_id)
+
+    batch_jobs = GpsBatchJobs(catalog, jvm, principal, keytab, vault=vault)
+
+    if sentinel_hub_credentials:
+        default_sentinel_hub_credentials = vault.get_sentinel_hub_credentials(
+            sentinel_hub_client_alias='default',
+            vault_token=vault.login_kerberos(principal, keytab))
+
+        batch_jobs.set_default_sentinel_hub_credentials(
+            client_id=default_sentinel_hub_credentials.client_id,
+            client_secret=default_sentinel_hub_credentials.client_secret)
+
+    return batch_jobs
+
+
+def _delete_batch_process_dependency_sources(arguments: dict, java_gateway: Optional[ClientServer], principal: str,
+                                             keytab: str):
+    batch_job_id = arguments[ARG_BATCH_JOB_ID]
+    user_id = arguments.get(ARG_USER_ID)
+    dependency_sources = _dependency_sources(arguments)
+
+    _log.info(f"removing dependency sources {dependency_sources} for batch job {batch_job_id}...",
+              extra={'job_id': batch_job_id})
+
+    # deleting doesn't involve the Sentinel Hub API: skip the Kerberos login and Vault lookup
+    batch_jobs = _get_batch_jobs(java_gateway, batch_job_id, user_id, principal, keytab,
+                                 sentinel_hub_credentials=False)
+    batch_jobs.delete_batch_process_dependency_sources(
+        job_id=batch_job_id,
+        dependency_sources=dependency_sources,
+        propagate_errors=True)
+
+
+def _await_dependencies(arguments: dict, java_gateway: Optional[ClientServer], principal: str, keytab: str):
+    batch_job_id = arguments[ARG_BATCH_JOB_ID]
+    user_id = arguments[ARG_USER_ID]
+    sentinel_hub_client_alias = arguments.get('sentinel_hub_client_alias', 'default')
+    vault_token = arguments.get('vault_token')
+
+    batch_jobs = _get_batch_jobs(java_gateway, batch_job_id, user_id, principal, keytab)
+    requests_session = requests_with_retry()
+
+    log = logging.LoggerAdapter(_log, extra={'job_id': batch_job_id, 'user_id': user_id})
+    max_poll_time = time.time() + DEPENDENCIES_MAX_POLL_DELAY_S
+    poll_interval = DEPENDENCIES_MIN_POLL_INTERVAL_S
+    previous_dependency_status = None
+
+    # TODO #236/#498/#632 phase out ZkJobRegistry (or at least abstract it away)
+    with ZkJobRegistry() as registry:
+        while True:
+            time.sleep(poll_interval)
+
+            job_info = registry.get_job(batch_job_id, user_id)
+
+            dependency_status = job_info.get("dependency_status")
+            if dependency_status != previous_dependency_status:
+                poll_interval = DEPENDENCIES_MIN_POLL_INTERVAL_S
+            else:
+                poll_interval = min(poll_interval * DEPENDENCIES_POLL_INTERVAL_BACKOFF_FACTOR,
+                                    DEPENDENCIES_MAX_POLL_INTERVAL_S)
+            previous_dependency_status = dependency_status
+
+            if dependency_status not in [
+                DEPENDENCY_STATUS.AWAITING,
+                DEPENDENCY_STATUS.AWAITING_RETRY,
+            ]:
+                break
+            else:
+                try:
+                    batch_jobs.poll_job_dependencies(job_info, sentinel_hub_client_alias, vault_token,
+                                                     requests_session)
+                except Exception:
+                    # TODO: retry in Nifi? How to mark this job as 'error' then?
+                    log.exception("failed to handle polling job dependencies")
+
+                    registry.set_status(batch_job_id, user_id, JOB_STATUS.ERROR)
+
+                    raise  # TODO: this will get caught by the exception handler in main() which will just log it again  # 141
+
+            if time.time() >= max_poll_time:
+                max_poll_delay_reached_error = f"job dependencies were not satisfied after" \
+                                               f" {DEPENDENCIES_MAX_POLL_DELAY_S} s, aborting"
+                log.error(max_poll_delay_reached_error)
+
+                registry.set_status(batch_job_id, user_id, JOB_STATUS.ERROR)
+
+                raise Exception(max_poll_delay_reached_error)
+
+
+_TASK_HANDLERS = {
+    TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES: _delete_batch_process_dependency_sources,
+    TASK_POLL_SENTINELHUB_BATCH_PROCESSES: _await_dependencies,
+    TASK_AWAIT_DEPENDENCIES: _await_dependencies,
+}
+
+
+class _StructuredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Default implementation merges args and exc_info into the message: keep the record as-is instead so
+        # the JsonFormatter on the listener side still produces structured output.
+        return record
+
+
 # TODO: DRY this, cleaner.sh and job_tracker.sh
 def main():
     import argparse
 
     logging.basicConfig(level=logging.INFO)
+    # not part of JSON_LOGGER_DEFAULT_FORMAT: don't look these up for every record
+    logging.logThreads = False
+    logging.logMultiprocessing = False
     openeogeotrellis.backend.logger.setLevel(logging.DEBUG)
     kazoo.client.log.setLevel(logging.WARNING)
 
     # Note: The Java logging is also supposed to match.
+    # Note: a single formatter instance (format parsed once) is shared by all handlers.
     json_formatter = JsonFormatter(JSON_LOGGER_DEFAULT_FORMAT)
 
     stdout_handler = logging.StreamHandler(stream=sys.stdout)
     stdout_handler.formatter = json_formatter
 
-    rolling_file_handler = RotatingFileHandler("logs/async_task_python.log", maxBytes=10 * 1024 * 1024, backupCount=1)
+    rolling_file_handler = RotatingFileHandler("logs/async_task_python.log", maxBytes=10 * 1024 * 1024, backupCount=1,
+                                               delay=True)
     rolling_file_handler.formatter = json_formatter
 
+    # do the actual (file) IO on a background thread
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, stdout_handler, rolling_file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
     root_logger = logging.getLogger()
-    root_logger.addHandler(stdout_handler)
-    root_logger.addHandler(rolling_file_handler)
+    root_logger.addHandler(_StructuredQueueHandler(log_queue))
 
-    _log.info("ConfigParams(): {c}".format(c=ConfigParams()))
+    _log.info("ConfigParams(): %s", get_config_params())
 
     parser = argparse.ArgumentParser(usage="OpenEO AsyncTask --task <task>",
                                      formatter_class=argparse.ArgumentDefaultsHelpFormatter)
@@ -171,11 +378,8 @@ def main():
 
     try:
         task_id = task['task_id']
-        if task_id not in [
-            TASK_POLL_SENTINELHUB_BATCH_PROCESSES,
-            TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES,
-            TASK_AWAIT_DEPENDENCIES
-        ]:
+        handler = _TASK_HANDLERS.get(task_id)
+        if handler is None:
             raise ValueError(f'unsupported task_id "{task_id}"')
 
         java_opts = [
@@ -189,107 +393,24 @@ def main():
                                             classpath=args.py4j_classpath,
                                             javaopts=java_opts,
                                             redirect_stdout=sys.stdout,
-                                            redirect_stderr=sys.stderr)
+                                            redirect_stderr=sys.stderr) if _requires_jvm(task_id, arguments) else None
 
         try:
-            def get_batch_jobs(batch_job_id: str, user_id: str) -> GpsBatchJobs:
-                vault = Vault(ConfigParams().vault_addr)
-                catalog = get_layer_catalog(vault=vault)
-
-                jvm = java_gateway.jvm
-                jvm.org.slf4j.MDC.put(jvm.org.openeo.logging.JsonLayout.UserId(), user_id)
-                jvm.org.slf4j.MDC.put(jvm.org.openeo.logging.JsonLayout.JobId(), batch_job_id)
-
-                batch_jobs = GpsBatchJobs(catalog, jvm, args.principal, args.keytab, vault=vault)
-
-                default_sentinel_hub_credentials = vault.get_sentinel_hub_credentials(
-                    sentinel_hub_client_alias='default',
-                    vault_token=vault.login_kerberos(args.principal, args.keytab))
-
-                batch_jobs.set_default_sentinel_hub_credentials(
-                    client_id=default_sentinel_hub_credentials.client_id,
-                    client_secret=default_sentinel_hub_credentials.client_secret)
-
-                return batch_jobs
-
-            if task_id == TASK_DELETE_BATCH_PROCESS_DEPENDENCY_SOURCES:
-                batch_job_id = arguments[ARG_BATCH_JOB_ID]
-                user_id = arguments.get(ARG_USER_ID)
-                dependency_sources = (arguments.get('dependency_sources')
-                                      or [f"s3://{sentinel_hub.OG_BATCH_RESULTS_BUCKET}/{subfolder}"
-                                          for subfolder in arguments['subfolders']])
-
-                _log.info(f"removing dependency sources {dependency_sources} for batch job {batch_job_id}...",
-                          extra={'job_id': batch_job_id})
-
-                batch_jobs = get_batch_jobs(batch_job_id, user_id)
-                batch_jobs.delete_batch_process_dependency_sources(
-                    job_id=batch_job_id,
-                    dependency_sources=dependency_sources,
-                    propagate_errors=True)
-            elif task_id in [TASK_POLL_SENTINELHUB_BATCH_PROCESSES, TASK_AWAIT_DEPENDENCIES]:
-                batch_job_id = arguments[ARG_BATCH_JOB_ID]
-                user_id = arguments[ARG_USER_ID]
-                sentinel_hub_client_alias = arguments.get('sentinel_hub_client_alias', 'default')
-                vault_token = arguments.get('vault_token')
-
-                batch_jobs = get_batch_jobs(batch_job_id, user_id)
-                requests_session = requests_with_retry()
-
-                log = logging.LoggerAdapter(_log, extra={'job_id': batch_job_id, 'user_id': user_id})
-                max_poll_time = time.time() + DEPENDENCIES_MAX_POLL_DELAY_S
-
-                while True:
-                    time.sleep(DEPENDENCIES_POLL_INTERVAL_S)
-
-                    # TODO #236/#498/#632 phase out ZkJobRegistry (or at least abstract it away)
-                    with ZkJobRegistry() as registry:
-                        job_info = registry.get_job(batch_job_id, user_id)
-
-                    if job_info.get("dependency_status") not in [
-                        DEPENDENCY_STATUS.AWAITING,
-                        DEPENDENCY_STATUS.AWAITING_RETRY,
-                    ]:
-                        break
-                    else:
-                        try:
-                            batch_jobs.poll_job_dependencies(job_info, sentinel_hub_client_alias, vault_token,
-                                                             requests_session)
-                        except Exception:
-                            # TODO: retry in Nifi? How to mark this job as 'error' then?
-                            log.exception("failed to handle polling job dependencies")
-
-                            # TODO #236/#498/#632 phase out ZkJobRegistry (or at least abstract it away)
-                            with ZkJobRegistry() as registry:
-                                registry.set_status(batch_job_id, user_id, JOB_STATUS.ERROR)
-
-                            raise  # TODO: this will get caught by the exception handler below which will just log it again  # 141
-
-                    if time.time() >= max_poll_time:
-                        max_poll_delay_reached_error = f"job dependencies were not satisfied after" \
-                                                       f" {DEPENDENCIES_MAX_POLL_DELAY_S} s, aborting"
-                        log.error(max_poll_delay_reached_error)
-
-                        # TODO #236/#498/#632 phase out ZkJobRegistry (or at least abstract it away)
-                        with ZkJobRegistry() as registry:
-                            registry.set_status(batch_job_id, user_id, JOB_STATUS.ERROR)
-
-                        raise Exception(max_poll_delay_reached_error)
-            else:
-                raise AssertionError(f'unexpected task_id "{task_id}"')
+            handler(arguments, java_gateway, args.principal, args.keytab)
         except JobNotFoundException as e:
             # TODO: look for "Deleted ..." log entry in Elasticsearch to avoid a false negative?
             _log.warning("job not found; assuming user deleted it in the meanwhile", exc_info=True,
                          extra={'job_id': e.job_id})
         finally:
-            java_gateway.shutdown()
+            if java_gateway:
+                java_gateway.shutdown()
     except Exception as e:
         extra = dict_no_none(
             job_id=arguments.get(ARG_BATCH_JOB_ID),
             user_id=arguments.get(ARG_USER_ID)
         )
 
-        _log.exception(f"failed to handle task {json.dumps(_redact(task))}", extra=extra)
+        _log.exception("failed to handle task %s", _redacted_json(task), extra=extra)
         raise e
 
 
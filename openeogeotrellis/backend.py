@@ -1927,7 +1927,7 @@ class GpsBatchJobs(backend.BatchJobs):
             # Check concurrent_pod_limit constraints.
             concurrent_pod_limit = ConfigParams().concurrent_pod_limit
             try:
-                with zk_client(hosts=ConfigParams().zookeepernodes) as zk:
+                with zk_client(hosts=",".join(ConfigParams().zookeepernodes)) as zk:
                     zk_path = f"{get_backend_config().zookeeper_root_path}/config/users/{user_id}/concurrent_pod_limit"
                     concurrent_pod_limit = int(zk.get(zk_path)[0])
                     log.info(f"concurrent_pod_limit for user {user_id} found: {concurrent_pod_limit}")
@@ -2067,10 +2067,14 @@ class GpsBatchJobs(backend.BatchJobs):
                     log.info(f"mapped job_id {job_id} to application ID {spark_app_id}")
                     dbl_registry.set_application_id(job_id, user_id, spark_app_id)
                     status_response = {}
-                    retry=0
-                    while('status' not in status_response and retry<10):
-                        retry+=1
-                        time.sleep(10)
+                    # Poll with exponential backoff (1s, 2s, 4s, ... capped at 10s) for at most 100s:
+                    # the app usually gets its status quickly, so don't make the caller wait a fixed 10s.
+                    poll_interval = 1
+                    waited = 0
+                    while 'status' not in status_response and waited < 100:
+                        time.sleep(poll_interval)
+                        waited += poll_interval
+                        poll_interval = min(2 * poll_interval, 10)
                         try:
                             status_response = api_instance_custom_object.get_namespaced_custom_object("sparkoperator.k8s.io", "v1beta2", pod_namespace, "sparkapplications",
                                                                                         spark_app_id)
@@ -2906,7 +2910,7 @@ class GpsBatchJobs(backend.BatchJobs):
         results_locations = [source for source in dependency_sources if is_s3_source(source)]
         assembled_folders = [urlparse(source).path for source in dependency_sources if is_disk_source(source)]
 
-        s3_service = self._jvm.org.openeo.geotrellissentinelhub.S3Service()
+        s3_service = self._jvm.org.openeo.geotrellissentinelhub.S3Service() if results_locations else None
 
         for results_location in results_locations:
             uri_parts = urlparse(results_location)
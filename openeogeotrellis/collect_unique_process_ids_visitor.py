@@ -7,6 +7,13 @@ class CollectUniqueProcessIdsVisitor(ProcessGraphVisitor):
     def __init__(self):
         super().__init__()
         self.process_ids = set()
+        self._visited_node_ids = set()
+
+    def accept_node(self, node: dict):
+        # a node can be referenced by several other nodes: don't walk its subgraph more than once
+        if id(node) not in self._visited_node_ids:
+            self._visited_node_ids.add(id(node))
+            super().accept_node(node)
 
     def enterProcess(self, process_id: str, arguments: dict, namespace: Union[str, None]):
         self.process_ids.add(process_id)
@@ -11,7 +11,8 @@ import sys
 import tempfile
 import types
 import zipfile
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from multiprocessing import Process
 from typing import Dict, Tuple, Union, List
 
@@ -36,6 +37,8 @@ from openeogeotrellis.utils import lonlat_to_mercator_tile_indices, nullcontext,
 logger = logging.getLogger(__name__)
 _SOFT_ERROR_TRACKER_ID = "orfeo_backscatter_soft_errors"
 _EXECUTION_TRACKER_ID = "orfeo_backscatter_execution_counter"
+# Maximum number of SRTM DEM tiles to unzip concurrently
+DEM_UNZIP_MAX_WORKERS = 8
 
 
 def _import_orfeo_toolbox(otb_home_env_var="OTB_HOME") -> types.ModuleType:
@@ -74,6 +77,9 @@ def _import_orfeo_toolbox(otb_home_env_var="OTB_HOME") -> types.ModuleType:
     return otb
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
 def _instant_ms_to_day(instant: int) -> datetime:
     """
     Convert Geotrellis SpaceTimeKey instant (Scala Long, millisecond resolution) to Python datetime object,
@@ -81,7 +87,7 @@ def _instant_ms_to_day(instant: int) -> datetime:
     of our openEO backend implementation and necessary to follow, for example
     to ensure that timeseries related data joins work properly.
     """
-    return datetime(*(datetime.utcfromtimestamp(instant // 1000).timetuple()[:3]))
+    return _EPOCH + timedelta(days=instant // (24 * 60 * 60 * 1000))
 
 
 def get_total_extent(features):
@@ -757,20 +763,26 @@ class S1BackscatterOrfeo:
         # Unzip to temp dir
         temp_dir = tempfile.TemporaryDirectory(suffix="-openeo-dem-srtm")
         msg = f"Unzip SRTM tiles from {srtm_root} in range lon [{lon_min}:{lon_max}] x lat [{lat_min}:{lat_max}] to {temp_dir}"
+
+        def unzip_tile(lon_lat: Tuple[int, int]):
+            lon, lat = lon_lat
+            # Something like: N50E003.SRTMGL1.hgt.zip"
+            basename = "{ns}{lat:02d}{ew}{lon:03d}.SRTMGL1.hgt".format(
+                ew="E" if lon >= 0 else "W",
+                lon=abs(lon),
+                ns="N" if lat >= 0 else "S",
+                lat=abs(lat),
+            )
+            zip_filename = pathlib.Path(srtm_root) / (basename + ".zip")
+            with zipfile.ZipFile(zip_filename, "r") as z:
+                logger.info(f"{zip_filename}: {z.infolist()}")
+                z.extractall(temp_dir.name)
+
+        lon_lats = [(lon, lat) for lon in range(lon_min, lon_max + 1) for lat in range(lat_min, lat_max + 1)]
         with TimingLogger(title=msg, logger=logger):
-            for lon in range(lon_min, lon_max + 1):
-                for lat in range(lat_min, lat_max + 1):
-                    # Something like: N50E003.SRTMGL1.hgt.zip"
-                    basename = "{ns}{lat:02d}{ew}{lon:03d}.SRTMGL1.hgt".format(
-                        ew="E" if lon >= 0 else "W",
-                        lon=abs(lon),
-                        ns="N" if lat >= 0 else "S",
-                        lat=abs(lat),
-                    )
-                    zip_filename = pathlib.Path(srtm_root) / (basename + ".zip")
-                    with zipfile.ZipFile(zip_filename, "r") as z:
-                        logger.info(f"{zip_filename}: {z.infolist()}")
-                        z.extractall(temp_dir.name)
+            # I/O bound: unzip tiles concurrently (`list` to propagate exceptions).
+            with ThreadPoolExecutor(max_workers=min(len(lon_lats), DEM_UNZIP_MAX_WORKERS)) as executor:
+                list(executor.map(unzip_tile, lon_lats))
 
         return temp_dir
 
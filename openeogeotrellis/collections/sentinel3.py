@@ -3,7 +3,7 @@ import logging
 import os
 import pathlib
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import partial
 from glob import glob
 from typing import Tuple
@@ -129,6 +129,9 @@ def pyramid(metadata_properties, projected_polygons_native_crs, from_date, to_da
     return {zoom: merged_tile_layer}
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
 def _instant_ms_to_hour(instant: int) -> datetime:
     """
     Convert Geotrellis SpaceTimeKey instant (Scala Long, millisecond resolution) to Python datetime object,
@@ -138,7 +141,7 @@ def _instant_ms_to_hour(instant: int) -> datetime:
 
     Sentinel-3 can have many observations per day, warranting the choice of hourly rather than daily aggregation
     """
-    return datetime(*(datetime.utcfromtimestamp(instant // 1000).timetuple()[:4]))
+    return _EPOCH + timedelta(hours=instant // (60 * 60 * 1000))
 
 
 @ensure_executor_logging
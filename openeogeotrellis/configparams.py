@@ -1,10 +1,18 @@
+import functools
 import os
 from pathlib import Path
 from pprint import pformat
-from typing import Optional
 
 from openeo_driver.utils import smart_bool
 
+# TODO eliminate hardcoded VITO resources
+_DEFAULT_ZOOKEEPERNODES = (
+    "epod-master1.vgt.vito.be:2181",
+    "epod-master2.vgt.vito.be:2181",
+    "epod-master3.vgt.vito.be:2181",
+)
+_DEFAULT_LAYER_CATALOG_METADATA_FILES = ("layercatalog.json",)
+
 
 class ConfigParams:
     # TODO: port all these params to GpsBackendConfig
@@ -14,10 +22,8 @@ class ConfigParams:
         self.openeo_env = env.get("OPENEO_ENV", "unknown")
 
         # TODO: replace usage with GpsBackendConfig.zookeeper_hosts
-        self.zookeepernodes = env.get(
-            "ZOOKEEPERNODES",
-            'epod-master1.vgt.vito.be:2181,epod-master2.vgt.vito.be:2181,epod-master3.vgt.vito.be:2181'
-        ).split(',')
+        zookeepernodes = env.get("ZOOKEEPERNODES")
+        self.zookeepernodes = tuple(zookeepernodes.split(",")) if zookeepernodes else _DEFAULT_ZOOKEEPERNODES
 
         # TODO: eliminate and leverage GpsBackendConfig.zookeeper_root_path instead
         self.batch_jobs_zookeeper_root_path = env.get(
@@ -25,7 +31,7 @@ class ConfigParams:
         )
 
         self.async_task_handler_environment = env.get("ASYNC_TASK_HANDLER_ENV")
-        self.cache_shub_batch_results = ConfigParams._as_boolean(env.get("CACHE_SHUB_BATCH_RESULTS"))
+        self.cache_shub_batch_results = smart_bool(env.get("CACHE_SHUB_BATCH_RESULTS", False))
 
         self.async_tasks_kafka_bootstrap_servers = env.get(
             "ASYNC_TASKS_KAFKA_BOOTSTRAP_SERVERS",
@@ -42,7 +48,11 @@ class ConfigParams:
         self.is_ci_context = any(v in env for v in ['PYTEST_CURRENT_TEST', 'PYTEST_CONFIGURE'])
 
         # TODO: can we avoid using env variables?
-        self.layer_catalog_metadata_files = env.get("OPENEO_CATALOG_FILES", "layercatalog.json").split(",")
+        layer_catalog_metadata_files = env.get("OPENEO_CATALOG_FILES")
+        self.layer_catalog_metadata_files = (
+            tuple(layer_catalog_metadata_files.split(",")) if layer_catalog_metadata_files
+            else _DEFAULT_LAYER_CATALOG_METADATA_FILES
+        )
 
         # TODO #283 using this "is_kube_deploy" switch is an anti-pattern (induces hard to maintain code and make unit testing difficult)
         self.is_kube_deploy = env.get("KUBE", False)
@@ -65,11 +75,6 @@ class ConfigParams:
     def __str__(self) -> str:
         return pformat(vars(self))
 
-    @staticmethod
-    def _as_boolean(envar_value: Optional[str]) -> bool:
-        # TODO: use `openeo_driver.utils.smart_bool` instead?
-        return envar_value is not None and envar_value.lower() == "true"
-
     @property
     def use_object_storage(self):
         """Whether or not to get the result files / assets from object storage.
@@ -80,3 +85,9 @@ class ConfigParams:
         See https://github.com/Open-EO/openeo-geopyspark-driver/issues/283
         """
         return self.is_kube_deploy
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_params() -> ConfigParams:
+    """Get a ConfigParams instance built from `os.environ` once and reused afterwards (e.g. in long-lived processes)."""
+    return ConfigParams()
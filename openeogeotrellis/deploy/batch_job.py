@@ -1,8 +1,11 @@
+import functools
 import json
 import logging
 import os
 import shutil
 import stat
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from traceback_with_variables import Format, format_exc
@@ -34,7 +37,7 @@ from openeogeotrellis.config import get_backend_config
 from openeogeotrellis.configparams import ConfigParams
 from openeogeotrellis.deploy import load_custom_processes
 from openeogeotrellis.deploy.batch_job_metadata import _assemble_result_metadata, _transform_stac_metadata, \
-    _convert_job_metadatafile_outputs_to_s3_urls, _get_tracker_metadata
+    _convert_job_metadatafile_outputs_to_s3_urls, _get_tracker_metadata, _write_json_atomically
 from openeogeotrellis.integrations.hadoop import setup_kerberos_auth
 from openeogeotrellis.udf import (collect_python_udf_dependencies, install_python_udf_dependencies,
                                   UDF_PYTHON_DEPENDENCIES_FOLDER_NAME, )
@@ -47,6 +50,15 @@ OPENEO_LOGGING_THRESHOLD = os.environ.get("OPENEO_LOGGING_THRESHOLD", "INFO")
 OPENEO_BATCH_JOB_ID = os.environ.get("OPENEO_BATCH_JOB_ID", "unknown-job")
 GlobalExtraLoggingFilter.set("job_id", OPENEO_BATCH_JOB_ID)
 
+# Files are uploaded in parallel, each with a single connection: stay within botocore's default
+# connection pool size (max_pool_connections=10) of the shared S3 client.
+S3_UPLOAD_MAX_WORKERS = 10
+# Concurrent multipart transfer threads for a single (large) file
+S3_TRANSFER_MAX_CONCURRENCY = 8
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+_INSTITUTION = "openEO platform - Geotrellis backend: " + __version__
+
 
 def _create_job_dir(job_dir: Path):
     logger.info("creating job dir {j!r} (parent dir: {p}))".format(j=job_dir, p=describe_path(job_dir.parent)))
@@ -122,12 +134,11 @@ def main(argv: List[str]) -> None:
 
     if ConfigParams().is_kube_deploy:
         if not get_backend_config().fuse_mount_batchjob_s3_bucket:
-            from openeogeotrellis.utils import s3_client
-
             bucket = os.environ.get('SWIFT_BUCKET')
-            s3_instance = s3_client()
+            s3_instance = _s3_client()
 
-            s3_instance.download_file(bucket, job_specification_file.strip("/"), job_specification_file )
+            s3_instance.download_file(bucket, job_specification_file.strip("/"), job_specification_file,
+                                      Config=_s3_transfer_config())
 
     job_specification = _parse(job_specification_file)
     load_custom_processes()
@@ -167,9 +178,11 @@ def main(argv: List[str]) -> None:
             profile_dumps_dir = job_dir / 'profile_dumps'
             sc.dump_profiles(profile_dumps_dir)
 
-            profile_zip = shutil.make_archive(base_name=str(profile_dumps_dir), format='gztar',
-                                              root_dir=profile_dumps_dir)
-            add_permissions(Path(profile_zip), stat.S_IWGRP)
+            # low compression level: profile dumps compress well enough and this is a lot faster than the default (9)
+            profile_zip = str(profile_dumps_dir) + ".tar.gz"
+            with tarfile.open(profile_zip, mode="w:gz", compresslevel=1) as tar:
+                tar.add(str(profile_dumps_dir), arcname=os.curdir)  # same layout as shutil.make_archive
+            add_permissions(profile_zip, stat.S_IWGRP)
 
             shutil.rmtree(profile_dumps_dir,
                           onerror=lambda func, path, exc_info:
@@ -205,9 +218,11 @@ def run_job(
         metadata_file = Path(metadata_file)
         job_dir = Path(job_dir)
 
-        logger.info(f"Job spec: {json.dumps(job_specification,indent=1)}")
-        logger.info(f"{job_dir=}, {job_dir.resolve()=}, {output_file=}, {metadata_file=}")
         process_graph = job_specification['process_graph']
+        logger.info(f"Job spec: keys={list(job_specification)} process graph nodes={len(process_graph)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Job spec: {json.dumps(job_specification, indent=1)}")
+        logger.info(f"{job_dir=}, {job_dir.resolve()=}, {output_file=}, {metadata_file=}")
         job_options = job_specification.get("job_options", {})
 
         try:
@@ -270,17 +285,22 @@ def run_job(
         global_metadata_attributes = {
             "title": job_specification.get("title", ""),
             "description": job_specification.get("description", ""),
-            "institution": "openEO platform - Geotrellis backend: " + __version__
+            "institution": _INSTITUTION
         }
 
         assets_metadata = {}
         ml_model_metadata = None
 
+        @functools.lru_cache(maxsize=1)
+        def filter_spatial_geometries():
+            # same for every result: look it up in the dry run graph at most once
+            return tracer.get_last_geometry("filter_spatial")
+
         for result in results:
             result.options["batch_mode"] = True
             result.options["file_metadata"] = global_metadata_attributes
             if result.options.get("sample_by_feature"):
-                geoms = tracer.get_last_geometry("filter_spatial")
+                geoms = filter_spatial_geometries()
                 if geoms is None:
                     logger.warning("sample_by_feature enabled, but no geometries found. "
                                    "They can be specified using filter_spatial.")
@@ -294,11 +314,14 @@ def run_job(
                 ml_model_metadata = result.get_model_metadata(str(output_file))
                 logger.info("Extracted ml model metadata from %s" % output_file)
             for name, asset in the_assets_metadata.items():
-                add_permissions(Path(asset["href"]), stat.S_IWGRP)
+                add_permissions(asset["href"], stat.S_IWGRP)
             logger.info(f"wrote {len(the_assets_metadata)} assets to {output_file}")
-            assets_metadata = {**assets_metadata, **the_assets_metadata}
+            assets_metadata.update(the_assets_metadata)
+
+        card4l_source_locations = {dependency['source_location'] for dependency in dependencies
+                                   if dependency['card4l']}
 
-        if any(dependency['card4l'] for dependency in dependencies):  # TODO: clean this up
+        if card4l_source_locations:  # TODO: clean this up
             logger.debug("awaiting Sentinel Hub CARD4L data...")
 
             s3_service = get_jvm().org.openeo.geotrellissentinelhub.S3Service()
@@ -306,9 +329,7 @@ def run_job(
             poll_interval_secs = 10
             max_delay_secs = 600
 
-            card4l_source_locations = [dependency['source_location'] for dependency in dependencies if dependency['card4l']]
-
-            for source_location in set(card4l_source_locations):
+            for source_location in card4l_source_locations:
                 uri_parts = urlparse(source_location)
                 bucket_name = uri_parts.hostname
                 request_group_id = uri_parts.path[1:]
@@ -362,8 +383,7 @@ def run_job(
     finally:
         metadata = {**result_metadata, **_get_tracker_metadata("")}
 
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f)
+        _write_json_atomically(metadata_file, metadata)
 
         add_permissions(metadata_file, stat.S_IWGRP)
 
@@ -371,17 +391,14 @@ def run_job(
 
         if ConfigParams().is_kube_deploy:
             if not get_backend_config().fuse_mount_batchjob_s3_bucket:
-                from openeogeotrellis.utils import s3_client
-
                 _convert_job_metadatafile_outputs_to_s3_urls(metadata_file)
 
                 bucket = os.environ.get('SWIFT_BUCKET')
-                s3_instance = s3_client()
+                s3_instance = _s3_client()
 
                 logger.info("Writing results to object storage")
-                for file in os.listdir(job_dir):
-                    full_path = str(job_dir) + "/" + file
-                    s3_instance.upload_file(full_path, bucket, full_path.strip("/"))
+                with os.scandir(job_dir) as entries:
+                    _upload_to_s3(s3_instance, bucket, [str(job_dir) + "/" + entry.name for entry in entries])
             else:
                 _convert_job_metadatafile_outputs_to_s3_urls(metadata_file)
 
@@ -394,6 +411,37 @@ def run_job(
                 raise
 
 
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    # boto3 is only imported (and the client only created) on kube deploys that don't mount the S3 bucket
+    from openeogeotrellis.utils import s3_client
+
+    return s3_client()
+
+
+def _s3_transfer_config(max_concurrency: int = S3_TRANSFER_MAX_CONCURRENCY):
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+        max_concurrency=max_concurrency,
+        use_threads=True,
+    )
+
+
+def _upload_to_s3(s3_instance, bucket: str, paths: List[str]):
+    """Upload files concurrently, each file to the key that corresponds with its path."""
+    # Parallelism comes from uploading multiple files at once, not from multipart threads per file.
+    transfer_config = _s3_transfer_config(max_concurrency=1)
+
+    def upload(path: str):
+        s3_instance.upload_file(path, bucket, path.strip("/"), Config=transfer_config)
+
+    with ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS) as executor:
+        list(executor.map(upload, paths))
+
+
 def _export_workspace(result: SaveResult, result_metadata: dict, stac_metadata_dir: Path):
     asset_paths = [Path(asset["href"]) for asset in result_metadata.get("assets", {}).values()]
     stac_paths = _write_exported_stac_collection(stac_metadata_dir, result_metadata)
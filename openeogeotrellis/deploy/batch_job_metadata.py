@@ -1,6 +1,10 @@
+import functools
 import json
 import logging
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
@@ -26,31 +30,26 @@ from openeogeotrellis.utils import (get_jvm, _make_set_for_key, to_s3_url, )
 
 logger = logging.getLogger(__name__)
 
+_BBOX_KEYS = ("west", "south", "east", "north")
+
+STAC_METADATA_TRANSFORM_MAX_WORKERS = 8
+
+_PROCESSING_SOFTWARE = "openeo-geotrellis-" + __version__
+
 
 def _assemble_result_metadata(tracer: DryRunDataTracer, result: SaveResult, output_file: Path,
                               unique_process_ids: Set[str], asset_metadata: Dict = None,
                               ml_model_metadata: Dict = None) -> dict:
     metadata = extract_result_metadata(tracer)
 
-    def epsg_code(gps_crs) -> Optional[int]:
-        crs = get_jvm().geopyspark.geotrellis.TileLayer.getCRS(gps_crs)
-        return crs.get().epsgCode().getOrElse(None) if crs.isDefined() else None
-
-    bands = []
-    if isinstance(result, GeopysparkDataCube):
-        if result.cube.metadata.has_band_dimension():
-            bands = result.metadata.bands
-        max_level = result.pyramid.levels[result.pyramid.max_zoom]
-        nodata = max_level.layer_metadata.no_data_value
-        epsg = epsg_code(max_level.layer_metadata.crs)
-        instruments = result.metadata.get("summaries", "instruments", default=[])
-    elif isinstance(result, ImageCollectionResult) and isinstance(result.cube, GeopysparkDataCube):
-        if result.cube.metadata.has_band_dimension():
-            bands = result.cube.metadata.bands
-        max_level = result.cube.pyramid.levels[result.cube.pyramid.max_zoom]
-        nodata = max_level.layer_metadata.no_data_value
-        epsg = epsg_code(max_level.layer_metadata.crs)
-        instruments = result.cube.metadata.get("summaries", "instruments", default=[])
+    cube = _get_geopyspark_data_cube(result)
+    if cube is not None:
+        bands = cube.metadata.bands if cube.metadata.has_band_dimension() else []
+        pyramid = cube.pyramid
+        layer_metadata = pyramid.levels[pyramid.max_zoom].layer_metadata
+        nodata = layer_metadata.no_data_value
+        epsg = _epsg_code(layer_metadata.crs)
+        instruments = cube.metadata.get("summaries", "instruments", default=[])
     else:
         bands = []
         nodata = None
@@ -87,7 +86,7 @@ def _assemble_result_metadata(tracer: DryRunDataTracer, result: SaveResult, outp
 
     metadata["instruments"] = instruments
     metadata["processing:facility"] = "VITO - SPARK"  # TODO make configurable
-    metadata["processing:software"] = "openeo-geotrellis-" + __version__
+    metadata["processing:software"] = _PROCESSING_SOFTWARE
     metadata["unique_process_ids"] = list(unique_process_ids)
     global_metadata = result.options.get("file_metadata",{})
     metadata["providers"] = global_metadata.get("providers",[])
@@ -98,18 +97,34 @@ def _assemble_result_metadata(tracer: DryRunDataTracer, result: SaveResult, outp
     return metadata
 
 
+def _get_geopyspark_data_cube(result: Union[SaveResult, GeopysparkDataCube]) -> Optional[GeopysparkDataCube]:
+    if isinstance(result, GeopysparkDataCube):
+        return result
+    if isinstance(result, ImageCollectionResult) and isinstance(result.cube, GeopysparkDataCube):
+        return result.cube
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _epsg_code(gps_crs: str) -> Optional[int]:
+    crs = get_jvm().geopyspark.geotrellis.TileLayer.getCRS(gps_crs)
+    return crs.get().epsgCode().getOrElse(None) if crs.isDefined() else None
+
+
 def extract_result_metadata(tracer: DryRunDataTracer) -> dict:
     logger.info("Extracting result metadata from {t!r}".format(t=tracer))
 
     rfc3339 = Rfc3339(propagate_none=True)
 
-    source_constraints = tracer.get_source_constraints()
-
     # Take union of extents
-    temporal_extent = temporal_extent_union(*[
-        sc["temporal_extent"] for _, sc in source_constraints if "temporal_extent" in sc
-    ])
-    extents = [sc["spatial_extent"] for _, sc in source_constraints if "spatial_extent" in sc]
+    temporal_extents = []
+    extents = []
+    for _, sc in tracer.get_source_constraints():
+        if "temporal_extent" in sc:
+            temporal_extents.append(sc["temporal_extent"])
+        if "spatial_extent" in sc:
+            extents.append(sc["spatial_extent"])
+    temporal_extent = temporal_extent_union(*temporal_extents)
     # In the result metadata we want the bbox to be in EPSG:4326 (lat-long).
     # Therefore, keep track of the bbox's CRS to convert it to EPSG:4326 at the end, if needed.
     bbox_crs = None
@@ -119,7 +134,7 @@ def extract_result_metadata(tracer: DryRunDataTracer) -> dict:
     if(len(extents) > 0):
         spatial_extent = spatial_extent_union(*extents)
         bbox_crs = spatial_extent["crs"]
-        temp_bbox = [spatial_extent[b] for b in ["west", "south", "east", "north"]]
+        temp_bbox = [spatial_extent[b] for b in _BBOX_KEYS]
         if all(b is not None for b in temp_bbox):
             bbox = temp_bbox  # Only set bbox once we are sure we have all the info
             polygon = Polygon.from_bounds(*bbox)
@@ -163,8 +178,7 @@ def extract_result_metadata(tracer: DryRunDataTracer) -> dict:
         if isinstance(bbox, tuple):
             bbox = list(bbox)
 
-    links = tracer.get_metadata_links()
-    links = [link for k, v in links.items() for link in v]
+    links = list(chain.from_iterable(tracer.get_metadata_links().values()))
 
     # Convert bbox to lat-long, EPSG:4326 if it was any other CRS.
     bbox = convert_bbox_to_lat_long(bbox, bbox_crs)
@@ -297,18 +311,41 @@ def convert_bbox_to_lat_long(bbox: List[int], bbox_crs: Optional[Union[str, int,
         latlon_spatial_extent = reproject_bounding_box(
             latlon_spatial_extent, from_crs=None, to_crs="EPSG:4326"
         )
-        return [latlon_spatial_extent[b] for b in ["west", "south", "east", "north"]]
+        return [latlon_spatial_extent[b] for b in _BBOX_KEYS]
 
     return bbox
 
 
+def _write_json_atomically(path: Union[str, os.PathLike], data: Any, indent: Optional[int] = None):
+    """
+    Write JSON to a temporary sibling file and move it into place, so readers never see a partially written file.
+    """
+    path = os.fspath(path)
+    # A unique temporary file, so concurrent writers of the same file don't clobber each other's temporary file.
+    tmp_file = tempfile.NamedTemporaryFile(
+        "wt", encoding="utf-8", dir=os.path.dirname(path) or os.curdir, suffix=".tmp", delete=False
+    )
+    try:
+        with tmp_file:
+            json.dump(data, tmp_file, indent=indent)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        try:
+            shutil.copymode(path, tmp_file.name)  # an overwritten file keeps its permissions
+        except FileNotFoundError:
+            os.chmod(tmp_file.name, 0o644)  # the temporary file is only accessible by its owner
+        os.replace(tmp_file.name, path)
+    except BaseException:
+        os.unlink(tmp_file.name)
+        raise
+
+
 def _convert_job_metadatafile_outputs_to_s3_urls(metadata_file: Path):
     """Convert each asset's output_dir value to a URL on S3, in the job metadata file."""
     with open(metadata_file, "rt") as mdf:
         metadata_to_update = json.load(mdf)
-    with open(metadata_file, "wt") as mdf:
-        _convert_asset_outputs_to_s3_urls(metadata_to_update)
-        json.dump(metadata_to_update, mdf)
+    _convert_asset_outputs_to_s3_urls(metadata_to_update)
+    _write_json_atomically(metadata_file, metadata_to_update)
 
 
 def _convert_asset_outputs_to_s3_urls(job_metadata: dict):
@@ -323,7 +360,7 @@ def _transform_stac_metadata(job_dir: Path):
     def relativize(assets: dict) -> dict:
         def relativize_href(asset: dict) -> dict:
             absolute_href = asset['href']
-            relative_path = urlparse(absolute_href).path.split("/")[-1]
+            relative_path = urlparse(absolute_href).path.rsplit("/", 1)[-1]
             return dict(asset, href=relative_path)
 
         return {asset_name: relativize_href(asset) for asset_name, asset in assets.items()}
@@ -333,18 +370,24 @@ def _transform_stac_metadata(job_dir: Path):
         result.pop('links', None)
         return result
 
-    stac_metadata_files = [job_dir / file_name for file_name in os.listdir(job_dir) if
-                           file_name.endswith("_metadata.json") and file_name != JOB_METADATA_FILENAME]
-
-    for stac_metadata_file in stac_metadata_files:
+    def transform(stac_metadata_file: Path):
         with open(stac_metadata_file, 'rt', encoding='utf-8') as f:
             stac_metadata = json.load(f)
 
         relative_assets = relativize(stac_metadata.get('assets', {}))
         transformed = dict(drop_links(stac_metadata), assets=relative_assets)
 
-        with open(stac_metadata_file, 'wt', encoding='utf-8') as f:
-            json.dump(transformed, f, indent=2)
+        _write_json_atomically(stac_metadata_file, transformed, indent=2)
+
+    with os.scandir(job_dir) as entries:
+        stac_metadata_files = [Path(entry.path) for entry in entries if
+                               entry.name.endswith("_metadata.json") and entry.name != JOB_METADATA_FILENAME]
+
+    if not stac_metadata_files:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(stac_metadata_files), STAC_METADATA_TRANSFORM_MAX_WORKERS)) as executor:
+        list(executor.map(transform, stac_metadata_files))
 
 
 def _get_tracker(tracker_id=""):
@@ -353,33 +396,33 @@ def _get_tracker(tracker_id=""):
 
 def _get_tracker_metadata(tracker_id="") -> dict:
     tracker = _get_tracker(tracker_id)
+    if tracker is None:
+        return {}
+
+    tracker_results = tracker.asDict()
+
+    usage = {}
+    pu = tracker_results.get("Sentinelhub_Processing_Units")
+    if pu is not None:
+        usage["sentinelhub"] = {"value": pu, "unit": "sentinelhub_processing_unit"}
+
+    pixels = tracker_results.get("InputPixels")
+    if pixels is not None:
+        usage["input_pixel"] = {"value": pixels / (1024 * 1024), "unit": "mega-pixel"}
+
+    links = tracker_results.get("links")
+    all_links = None
+    if links is not None:
+        # TODO: when in the future these links point to STAC objects we will need to update the type.
+        #   https://github.com/openEOPlatform/architecture-docs/issues/327
+        all_links = [
+            {
+                "href": link.getSelfUrl(),
+                "rel": "derived_from",
+                "title": f"Derived from {link.getId()}",
+                "type": "application/json",
+            }
+            for link in chain.from_iterable(links.values())
+        ]
 
-    if tracker is not None:
-        tracker_results = tracker.asDict()
-
-        usage = {}
-        pu = tracker_results.get("Sentinelhub_Processing_Units", None)
-        if pu is not None:
-            usage["sentinelhub"] = {"value": pu, "unit": "sentinelhub_processing_unit"}
-
-        pixels = tracker_results.get("InputPixels", None)
-        if pixels is not None:
-            usage["input_pixel"] = {"value": pixels / (1024 * 1024), "unit": "mega-pixel"}
-
-        links = tracker_results.get("links", None)
-        all_links = None
-        if links is not None:
-            all_links = list(chain(*links.values()))
-            # TODO: when in the future these links point to STAC objects we will need to update the type.
-            #   https://github.com/openEOPlatform/architecture-docs/issues/327
-            all_links = [
-                {
-                    "href": link.getSelfUrl(),
-                    "rel": "derived_from",
-                    "title": f"Derived from {link.getId()}",
-                    "type": "application/json",
-                }
-                for link in all_links
-            ]
-
-        return dict_no_none(usage=usage if usage != {} else None, links=all_links)
+    return dict_no_none(usage=usage or None, links=all_links)
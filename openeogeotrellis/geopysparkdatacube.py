@@ -1414,7 +1414,7 @@ class GeopysparkDataCube(DriverDataCube):
         for v in values:
             if isinstance(v,float):
                 result["NoDate"]=v
-            elif "isoformat" in dir(v[0]):
+            elif hasattr(v[0], "isoformat"):
                 result[v[0].isoformat()]=v[1]
             elif v[0] is None:
                 #empty timeseries
@@ -55,21 +55,22 @@ class K8S_SPARK_APP_STATE:
     UNKNOWN = "UNKNOWN"
 
 
+_K8S_STATE_TO_OPENEO_JOB_STATUS = {
+    K8S_SPARK_APP_STATE.NEW: JOB_STATUS.QUEUED,
+    K8S_SPARK_APP_STATE.SUBMITTED: JOB_STATUS.QUEUED,
+    K8S_SPARK_APP_STATE.RUNNING: JOB_STATUS.RUNNING,
+    K8S_SPARK_APP_STATE.SUCCEEDING: JOB_STATUS.RUNNING,
+    K8S_SPARK_APP_STATE.COMPLETED: JOB_STATUS.FINISHED,
+    K8S_SPARK_APP_STATE.FAILED: JOB_STATUS.ERROR,
+    K8S_SPARK_APP_STATE.SUBMISSION_FAILED: JOB_STATUS.ERROR,
+    K8S_SPARK_APP_STATE.FAILING: JOB_STATUS.ERROR,
+}
+
+
 def k8s_state_to_openeo_job_status(state: str) -> str:
     """Map Kubernetes app state to openEO batch job status"""
-    if state in {K8S_SPARK_APP_STATE.NEW, K8S_SPARK_APP_STATE.SUBMITTED}:
-        job_status = JOB_STATUS.QUEUED
-    elif state in {K8S_SPARK_APP_STATE.RUNNING, K8S_SPARK_APP_STATE.SUCCEEDING}:
-        job_status = JOB_STATUS.RUNNING
-    elif state == K8S_SPARK_APP_STATE.COMPLETED:
-        job_status = JOB_STATUS.FINISHED
-    elif state in {
-        K8S_SPARK_APP_STATE.FAILED,
-        K8S_SPARK_APP_STATE.SUBMISSION_FAILED,
-        K8S_SPARK_APP_STATE.FAILING,
-    }:
-        job_status = JOB_STATUS.ERROR
-    else:
+    job_status = _K8S_STATE_TO_OPENEO_JOB_STATUS.get(state)
+    if job_status is None:
         _log.warning(f"Unhandled K8s app state mapping {state}")
         # Fallback to minimal status "queued" (once in K8s, batch job status should be at least "queued")
         job_status = JOB_STATUS.QUEUED
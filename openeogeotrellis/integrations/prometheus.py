@@ -2,13 +2,21 @@ from typing import Optional
 
 import requests
 
+REQUESTS_TIMEOUT_SECONDS = 60
+
 
 class Prometheus:
     # TODO: does filtering on pod namespace speed things up?
 
-    def __init__(self, endpoint: str):
-        """Point this to e.g. http://example.org:9090/api/v1."""
+    def __init__(self, endpoint: str, requests_session: Optional[requests.Session] = None):
+        """
+        Point this to e.g. http://example.org:9090/api/v1.
+
+        :param requests_session: (optional) provide a `requests.Session` (e.g. with desired retry settings)
+        """
         self.endpoint = endpoint
+        # Reuse connections across the (multiple) queries per job
+        self._session = requests_session or requests.Session()
 
     def _query_for_float(self, query: str, time: str = None) -> Optional[float]:
         params = {
@@ -18,7 +26,7 @@ class Prometheus:
         if time is not None:
             params['time'] = time
 
-        with requests.get(self.endpoint + "/query", params=params) as resp:
+        with self._session.get(self.endpoint + "/query", params=params, timeout=REQUESTS_TIMEOUT_SECONDS) as resp:
             resp.raise_for_status()
             entity = resp.json()
 
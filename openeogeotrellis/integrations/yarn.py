@@ -34,23 +34,30 @@ class YARN_FINAL_STATUS:
     UNDEFINED = "UNDEFINED"
 
 
+# Job status for YARN app states that don't depend on the final status
+_YARN_STATE_TO_OPENEO_JOB_STATUS = {
+    # Note: once app is in YARN (the user triggered start of batch job)
+    # the batch job status should be at least "queued" ("created" is reserved for pre-start phase).
+    YARN_STATE.NEW: JOB_STATUS.QUEUED,
+    YARN_STATE.SUBMITTED: JOB_STATUS.QUEUED,
+    YARN_STATE.ACCEPTED: JOB_STATUS.QUEUED,
+    YARN_STATE.RUNNING: JOB_STATUS.RUNNING,
+}
+
+
 def yarn_state_to_openeo_job_status(state: str, final_state: str) -> str:
     """Map YARN app state to openEO batch job status"""
-    if state in {YARN_STATE.NEW, YARN_STATE.SUBMITTED, YARN_STATE.ACCEPTED}:
-        # Note: once app is in YARN (the user triggered start of batch job)
-        # the batch job status should be at least "queued" ("created" is reserved for pre-start phase).
-        job_status = JOB_STATUS.QUEUED
-    elif state == YARN_STATE.RUNNING:
-        job_status = JOB_STATUS.RUNNING
-    elif state == YARN_STATE.KILLED or final_state == YARN_FINAL_STATUS.KILLED:
-        job_status = JOB_STATUS.CANCELED
-    elif final_state == YARN_FINAL_STATUS.SUCCEEDED:
-        job_status = JOB_STATUS.FINISHED
-    elif final_state == YARN_STATE.FAILED:
-        job_status = JOB_STATUS.ERROR
-    else:
-        _log.warning(f"Unhandled YARN app state mapping: {(state, final_state)}")
-        # Fallback to minimal status "queued" (once in YARN, batch job status should be at least "queued")
-        job_status = JOB_STATUS.QUEUED
+    job_status = _YARN_STATE_TO_OPENEO_JOB_STATUS.get(state)
+    if job_status is None:
+        if state == YARN_STATE.KILLED or final_state == YARN_FINAL_STATUS.KILLED:
+            job_status = JOB_STATUS.CANCELED
+        elif final_state == YARN_FINAL_STATUS.SUCCEEDED:
+            job_status = JOB_STATUS.FINISHED
+        elif final_state == YARN_STATE.FAILED:
+            job_status = JOB_STATUS.ERROR
+        else:
+            _log.warning(f"Unhandled YARN app state mapping: {(state, final_state)}")
+            # Fallback to minimal status "queued" (once in YARN, batch job status should be at least "queued")
+            job_status = JOB_STATUS.QUEUED
 
     return job_status
@@ -1,6 +1,7 @@
 import abc
 import datetime as dt
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, NamedTuple, Optional
 
 from openeo_driver.util.caching import TtlCache
@@ -11,6 +12,9 @@ from openeogeotrellis.integrations.etl_api import ETL_API_STATUS, EtlApi, get_et
 
 _log = logging.getLogger(__name__)
 
+# Maximum number of concurrent "added value" requests per job
+ADDED_VALUE_MAX_WORKERS = 8
+
 
 class CostsDetails(NamedTuple):  # for lack of a better name
     """
@@ -81,16 +85,25 @@ class EtlApiJobCostsCalculator(JobCostsCalculator):
             added_value_costs_in_credits = 0.0
             _log.debug("not logging added value because area is None")
         else:
-            added_value_costs_in_credits = sum(self._etl_api.log_added_value(
-                batch_job_id=details.job_id,
-                title=details.job_title,
-                execution_id=details.execution_id,
-                user_id=details.user_id,
-                started_ms=started_ms,
-                finished_ms=finished_ms,
-                process_id=process_id,
-                square_meters=details.area_square_meters,
-                ) for process_id in details.unique_process_ids)
+            def log_added_value(process_id: str) -> float:
+                return self._etl_api.log_added_value(
+                    batch_job_id=details.job_id,
+                    title=details.job_title,
+                    execution_id=details.execution_id,
+                    user_id=details.user_id,
+                    started_ms=started_ms,
+                    finished_ms=finished_ms,
+                    process_id=process_id,
+                    square_meters=details.area_square_meters,
+                )
+
+            process_ids = details.unique_process_ids
+            if len(process_ids) > 1:
+                # One request per process: do them concurrently
+                with ThreadPoolExecutor(max_workers=min(len(process_ids), ADDED_VALUE_MAX_WORKERS)) as executor:
+                    added_value_costs_in_credits = sum(executor.map(log_added_value, process_ids))
+            else:
+                added_value_costs_in_credits = sum(map(log_added_value, process_ids))
 
         return resource_costs_in_credits + added_value_costs_in_credits
 
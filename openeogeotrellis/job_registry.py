@@ -31,6 +31,9 @@ from openeogeotrellis.utils import StatsReporter
 
 _log = logging.getLogger(__name__)
 
+# Job statuses after which a job doesn't have to be tracked anymore
+_FINAL_JOB_STATUSES = frozenset({JOB_STATUS.FINISHED, JOB_STATUS.ERROR, JOB_STATUS.CANCELED})
+
 
 class ZkJobRegistry:
     # TODO: improve encapsulation
@@ -111,10 +114,15 @@ class ZkJobRegistry:
 
     def set_status(
         self, job_id: str, user_id: str, status: str, started: Optional[str] = None, finished: Optional[str] = None,
-            auto_mark_done: bool = True
+            auto_mark_done: bool = True, **extra
     ) -> None:
-        """Updates a registered batch job with its status. Additionally, updates its "updated" property."""
+        """
+        Updates a registered batch job with its status. Additionally, updates its "updated" property.
+
+        :param extra: additional fields to patch in the same update
+        """
         kwargs = {
+            **extra,
             "status": status,
             "updated": rfc3339.utcnow(),
         }
@@ -130,11 +138,11 @@ class ZkJobRegistry:
             auto_mark_done=auto_mark_done,
             **kwargs
         )
-        _log.debug("batch job {j} -> {s}".format(j=job_id, s=status))
+        _log.debug("batch job %s -> %s", job_id, status)
 
     def set_dependency_status(self, job_id: str, user_id: str, dependency_status: str) -> None:
         self.patch(job_id, user_id, dependency_status=dependency_status)
-        _log.debug("batch job {j} dependency -> {s}".format(j=job_id, s=dependency_status))
+        _log.debug("batch job %s dependency -> %s", job_id, dependency_status)
 
     def set_dependency_usage(self, job_id: str, user_id: str, processing_units: Decimal):
         self.patch(job_id, user_id, dependency_usage=str(processing_units))
@@ -157,28 +165,38 @@ class ZkJobRegistry:
         # TODO make this a private method to have cleaner API
         # TODO: is there still need to have `auto_mark_done` as public argument?
         job_info, version = self._read(job_id, user_id)
-        self._update({**job_info, **kwargs}, version)
+        job_info = {**job_info, **kwargs}
+        version = self._update(job_info, version)
 
-        if auto_mark_done and kwargs.get("status") in {
-            JOB_STATUS.FINISHED,
-            JOB_STATUS.ERROR,
-            JOB_STATUS.CANCELED,
-        }:
-            self._mark_done(job_id=job_id, user_id=user_id)
+        if auto_mark_done and kwargs.get("status") in _FINAL_JOB_STATUSES:
+            # We just wrote the job info: no need to read it again.
+            self._mark_done(job_id=job_id, user_id=user_id, job_info=job_info, version=version)
 
-    def _mark_done(self, job_id: str, user_id: str) -> None:
-        """Marks a job as done (not to be tracked anymore)."""
-        # FIXME: can be done in a transaction
-        job_info, version = self._read(job_id, user_id)
+    def _mark_done(
+        self, job_id: str, user_id: str, job_info: Optional[Dict] = None, version: Optional[int] = None
+    ) -> None:
+        """
+        Marks a job as done (not to be tracked anymore).
+
+        :param job_info: current job info (with its znode `version`), if already known
+        """
+        if job_info is None:
+            job_info, version = self._read(job_id, user_id)
 
         source = self._ongoing(user_id, job_id)
 
-        try:
-            self._create(job_info, done=True)
-        except NodeExistsError:
-            pass
+        # Move from "ongoing" to "done" in a single (atomic) request.
+        transaction = self._zk.transaction()
+        transaction.create(self._done(user_id, job_id), json.dumps(job_info).encode("utf-8"))
+        transaction.delete(source, version)
+        if any(isinstance(r, Exception) for r in transaction.commit()):
+            # E.g. no "done" node for this user yet, or job already marked done: fall back on separate requests.
+            try:
+                self._create(job_info, done=True)
+            except NodeExistsError:
+                pass
 
-        self._zk.delete(source, version)
+            self._zk.delete(source, version)
 
         _log.info(f"Marked {job_id} as done", extra={"job_id": job_id})
 
@@ -198,17 +216,30 @@ class ZkJobRegistry:
 
         self._zk.delete(source, version)
 
-    def get_running_jobs(self, *, user_limit: Optional[int] = 1000, parse_specification: bool = True) -> Iterator[Dict]:
-        """Returns an interator job info dicts that are currently not finished (should still be tracked)."""
+    def get_running_jobs(
+        self,
+        *,
+        user_limit: Optional[int] = 1000,
+        parse_specification: bool = True,
+        omit_raw_specification: bool = False,
+    ) -> Iterator[Dict]:
+        """
+        Returns an interator job info dicts that are currently not finished (should still be tracked).
+
+        :param omit_raw_specification: remove the original (raw) "specification" field from the results
+            (e.g. to reduce memory usage when the results are collected)
+        """
 
         with StatsReporter(name="get_running_jobs", report=_log) as stats, TimingLogger(
             title="get_running_jobs", logger=_log
         ):
             user_ids = self._zk.get_children(self._ongoing())
+            # Issue all requests up front (asynchronously) so they are pipelined instead of doing a round trip per znode.
+            user_job_ids = [(user_id, self._zk.get_children_async(self._ongoing(user_id))) for user_id in user_ids]
 
-            for user_id in user_ids:
+            for user_id, async_job_ids in user_job_ids:
                 stats["user_id"] += 1
-                job_ids = self._zk.get_children(self._ongoing(user_id))
+                job_ids = async_job_ids.get()
 
                 if user_limit and len(job_ids) > user_limit:
                     _log.warning(
@@ -221,11 +252,25 @@ class ZkJobRegistry:
 
                 if job_ids:
                     stats["user_id with jobs"] += 1
-                    for job_id in job_ids:
-                        job_info = self.get_job(job_id, user_id, parse_specification=parse_specification)
-                        if job_info.get("application_id"):
-                            yield job_info
-                            stats["job_ids"] += 1
+                    async_reads = [(job_id, self._zk.get_async(self._ongoing(user_id, job_id))) for job_id in job_ids]
+                    for job_id, async_read in async_reads:
+                        try:
+                            data, _ = async_read.get()
+                        except NoNodeError:
+                            # Job was moved to "done" in the meantime
+                            stats["job gone"] += 1
+                            continue
+                        job_info = self._decode(data)
+                        if not job_info.get("application_id"):
+                            # Not submitted yet: nothing to track (so don't bother parsing the specification).
+                            stats["no application_id"] += 1
+                            continue
+                        if parse_specification:
+                            self._parse_specification(job_info)
+                        if omit_raw_specification:
+                            del job_info["specification"]
+                        yield job_info
+                        stats["job_ids"] += 1
                 else:
                     stats["user_id without jobs"] += 1
 
@@ -344,7 +389,7 @@ class ZkJobRegistry:
                                 else datetime.utcfromtimestamp(stat.last_modified))
 
                     if job_date < upper:
-                        _log.debug("job {j}'s job_date {d} is before {u}".format(j=job_id, d=job_date, u=upper))
+                        _log.debug("job %s's job_date %s is before %s", job_id, job_date, upper)
                         if field_whitelist:
                             job_info = {k: job_info[k] for k in field_whitelist if k in job_info}
                         jobs_before.append(job_info)
@@ -402,27 +447,41 @@ class ZkJobRegistry:
             else:
                 raise JobNotFoundException(job_id) from e
 
+        job_info = self._decode(
+            data, parse_specification=parse_specification, omit_raw_specification=omit_raw_specification
+        )
+        return job_info, stat.version
+
+    @staticmethod
+    def _decode(data: bytes, *, parse_specification: bool = False, omit_raw_specification: bool = False) -> Dict:
+        """Decode job info from znode data (see `_read` for the meaning of the flags)."""
         job_info = json.loads(data.decode())
         if parse_specification:
-            process_graph, job_options = parse_zk_job_specification(job_info)
-            if "process" not in job_info:
-                job_info["process"] = {"process_graph": process_graph}
-            if "job_options" not in job_info:
-                job_info["job_options"] = job_options
+            ZkJobRegistry._parse_specification(job_info)
 
         if omit_raw_specification:
             del job_info["specification"]
 
-        return job_info, stat.version
+        return job_info
 
-    def _update(self, job_info: Dict, version: int) -> None:
+    @staticmethod
+    def _parse_specification(job_info: Dict) -> None:
+        """Add "process" and "job_options" (in-place) from the raw "specification" of given job info."""
+        process_graph, job_options = parse_zk_job_specification(job_info)
+        if "process" not in job_info:
+            job_info["process"] = {"process_graph": process_graph}
+        if "job_options" not in job_info:
+            job_info["job_options"] = job_options
+
+    def _update(self, job_info: Dict, version: int) -> int:
+        """Write job info (if znode is still at given version) and return the new znode version."""
         job_id = job_info['job_id']
         user_id = job_info['user_id']
 
         path = self._ongoing(user_id, job_id)
         data = json.dumps(job_info).encode("utf-8")
 
-        self._zk.set(path, data, version)
+        return self._zk.set(path, data, version).version
 
     def _ongoing(self, user_id: str = None, job_id: str = None) -> str:
         if job_id:
@@ -875,8 +934,10 @@ class DoubleJobRegistry:  # TODO: extend JobRegistryInterface?
 
     def set_status(self, job_id: str, user_id: str, status: str,
                    started: Optional[str] = None, finished: Optional[str] = None,
+                   *, skip_zk: bool = False,
                    ) -> None:
-        if self.zk_job_registry:
+        # `skip_zk`: caller knows the ZkJobRegistry is already up to date (EJR is still written to heal drift)
+        if self.zk_job_registry and not skip_zk:
             self.zk_job_registry.set_status(job_id=job_id, user_id=user_id, status=status, started=started,
                                             finished=finished)
         if self.elastic_job_registry:
@@ -998,7 +1059,8 @@ class DoubleJobRegistry:  # TODO: extend JobRegistryInterface?
     def get_active_jobs(self) -> Iterator[Dict]:
         if self.zk_job_registry:
             # Note: `parse_specification` is enabled here because the jobtracker needs job_options (e.g. to determine target ETL)
-            yield from self.zk_job_registry.get_running_jobs(parse_specification=True)
+            # The raw specification is not needed after that: drop it as the jobtracker collects all active jobs in memory.
+            yield from self.zk_job_registry.get_running_jobs(parse_specification=True, omit_raw_specification=True)
         elif self.elastic_job_registry:
             yield from self.elastic_job_registry.list_trackable_jobs(fields=[
                 "job_id", "user_id", "application_id", "status", "created", "title", "job_options", "dependencies",
@@ -1006,11 +1068,22 @@ class DoubleJobRegistry:  # TODO: extend JobRegistryInterface?
             ])
 
     def set_results_metadata(self, job_id, user_id, costs: Optional[float], usage: dict,
-                             results_metadata: Dict[str, Any]):
+                             results_metadata: Dict[str, Any], *, status: Optional[str] = None,
+                             started: Optional[str] = None, finished: Optional[str] = None):
+        """
+        Store results metadata of a job
+        and optionally (if `status` is given) its status too, in a single ZooKeeper update.
+        """
         if self.zk_job_registry:
-            self.zk_job_registry.patch(job_id=job_id, user_id=user_id,
-                                       **dict(results_metadata, costs=costs, usage=usage))
+            fields = dict(results_metadata, costs=costs, usage=usage)
+            if status:
+                self.zk_job_registry.set_status(job_id=job_id, user_id=user_id, status=status, started=started,
+                                                finished=finished, **fields)
+            else:
+                self.zk_job_registry.patch(job_id=job_id, user_id=user_id, **fields)
 
         if self.elastic_job_registry:
             self.elastic_job_registry.set_results_metadata(job_id=job_id, costs=costs, usage=usage,
                                                            results_metadata=results_metadata)
+            if status:
+                self.elastic_job_registry.set_status(job_id=job_id, status=status, started=started, finished=finished)
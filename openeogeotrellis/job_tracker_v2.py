@@ -6,12 +6,13 @@ V2 implementation of JobTracker
 import abc
 import argparse
 import collections
+import concurrent.futures
 import datetime as dt
 import logging
 from decimal import Decimal
 from math import isfinite
 from pathlib import Path
-from typing import Any, List, NamedTuple, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 import requests
 
@@ -26,6 +27,7 @@ except ImportError:
 
 from openeo.util import TimingLogger, repr_truncate, Rfc3339, url_join, deep_get
 from openeo_driver.jobregistry import JOB_STATUS, ElasticJobRegistry
+from openeo_driver.util.caching import TtlCache
 from openeo_driver.util.http import requests_with_retry
 from openeo_driver.util.logging import (
     get_logging_config,
@@ -52,13 +54,39 @@ from openeogeotrellis.job_costs_calculator import (
     CostsDetails,
     DynamicEtlApiJobCostCalculator,
 )
-from openeogeotrellis.job_registry import DoubleJobRegistry, ZkJobRegistry, get_deletable_dependency_sources
+from openeogeotrellis.job_registry import (
+    _FINAL_JOB_STATUSES,
+    DoubleJobRegistry,
+    ZkJobRegistry,
+    get_deletable_dependency_sources,
+)
 from openeogeotrellis.utils import StatsReporter, dict_merge_recursive
 
 
 # Note: hardcoded logger name as this script is executed directly which kills the usefulness of `__name__`.
 _log = logging.getLogger("openeogeotrellis.job_tracker_v2")
 
+RESULTS_METADATA_CACHE_TTL = 5 * 60
+
+USAGE_CACHE_TTL = 60
+
+_EPOCH = dt.datetime(1970, 1, 1)
+
+_rfc3339 = Rfc3339(propagate_none=True)
+
+
+def _parse_rfc3339(value: Optional[str]) -> Optional[dt.datetime]:
+    """
+    Parse RFC3339 UTC timestamp (e.g. "2022-12-14T12:34:56Z") to naive datetime (or None),
+    with a fast path through `datetime.fromisoformat` (instead of regex + strptime).
+    """
+    if isinstance(value, str) and value.endswith("Z"):
+        try:
+            return dt.datetime.fromisoformat(value[:-1])
+        except ValueError:
+            pass
+    return _rfc3339.parse_datetime(value)
+
 
 class _Usage(NamedTuple):
     cpu_seconds: Optional[float] = None
@@ -112,6 +140,15 @@ class JobMetadataGetterInterface(metaclass=abc.ABCMeta):
     def get_job_metadata(self, job_id: str, user_id: str, app_id: str) -> _JobMetadata:
         raise NotImplementedError
 
+    def preload(self, app_ids: List[str]) -> None:
+        """
+        Hint that the metadata of these apps will be requested soon,
+        so implementations can fetch it in bulk instead of doing a request per app.
+        Subsequent `get_job_metadata` calls can use (and consume) the preloaded data,
+        and should fall back on a dedicated request for apps that were not preloaded.
+        """
+        pass
+
     @classmethod
     @abc.abstractmethod
     def app_state_to_etl_state(cls, app_state: str) -> str:
@@ -132,6 +169,10 @@ class YarnAppReportParseException(Exception):
     pass
 
 
+# Tag set on openEO batch job apps at submit time (`spark.yarn.tags`)
+YARN_APPLICATION_TAG = "openeo"
+
+
 class YarnStatusGetter(JobMetadataGetterInterface):
     """YARN app status getter"""
 
@@ -143,7 +184,7 @@ class YarnStatusGetter(JobMetadataGetterInterface):
             See also: get_application_url(...)
 
         :param auth:
-            If specified, this is the authentication passed to requests.get(...)
+            If specified, this is the authentication passed with each request
             Defaults to None, and by default no authentication will be used.
 
             Normally we use Kerberos and then you should pass an instance of
@@ -155,6 +196,13 @@ class YarnStatusGetter(JobMetadataGetterInterface):
         """
         self.yarn_api_base_url = yarn_api_base_url
         self.auth = auth
+        # Reuse connections (and authentication handshakes) across requests
+        self._session = requests.Session()
+        # App reports (keyed by app id) fetched in bulk with `preload`
+        self._app_reports: Dict[str, dict] = {}
+        # ETag and app reports of the previous app listing, to do conditional requests
+        self._apps_listing_etag: Optional[str] = None
+        self._apps_listing: List[dict] = []
 
     def get_application_url(self, application_id: str) -> str:
         """Get the URL to get the application status from the YARN REST API.
@@ -168,9 +216,50 @@ class YarnStatusGetter(JobMetadataGetterInterface):
             f"/ws/v1/cluster/apps/{application_id}",
         )
 
+    def get_applications_url(self) -> str:
+        """Get the URL to list applications from the YARN REST API."""
+        return url_join(self.yarn_api_base_url, "/ws/v1/cluster/apps")
+
+    # Only list unfinished apps: the finished ones pile up in the listing (until YARN evicts them).
+    # Jobs whose app is not in the listing (e.g. because it just finished) fall back on a per app request.
+    _PRELOAD_APP_STATES = ["NEW", "NEW_SAVING", "SUBMITTED", "ACCEPTED", "RUNNING"]
+
+    def preload(self, app_ids: List[str]) -> None:
+        """List the openEO apps with a single request, instead of requesting the status of each app separately."""
+        self._app_reports = {}
+        if not app_ids:
+            return
+        headers = {"If-None-Match": self._apps_listing_etag} if self._apps_listing_etag else None
+        try:
+            response = self._session.get(
+                self.get_applications_url(),
+                params={"applicationTags": YARN_APPLICATION_TAG, "states": ",".join(self._PRELOAD_APP_STATES)},
+                headers=headers,
+                auth=self.auth,
+            )
+            if response.status_code == 304:
+                # Nothing changed since the previous listing: skip parsing.
+                reports = self._apps_listing
+            else:
+                response.raise_for_status()
+                reports = (response.json().get("apps") or {}).get("app") or []
+                self._apps_listing_etag = response.headers.get("ETag")
+                self._apps_listing = reports
+        except Exception as e:
+            _log.warning(f"Failed to list YARN apps, falling back on per app requests: {type(e).__name__}: {e}")
+            return
+
+        wanted = set(app_ids)
+        self._app_reports = {report["id"]: report for report in reports if report.get("id") in wanted}
+        _log.debug(f"Preloaded {len(self._app_reports)} of {len(wanted)} YARN app reports")
+
     def get_job_metadata(self, job_id: str, user_id: str, app_id: str) -> _JobMetadata:
+        report = self._app_reports.pop(app_id, None)
+        if report is not None:
+            return self.parse_application_response(data={"app": report}, job_id=job_id, user_id=user_id)
+
         url = self.get_application_url(application_id=app_id)
-        response = requests.get(url, auth=self.auth)
+        response = self._session.get(url, auth=self.auth)
         if response.status_code == 404:
             raise AppNotFound(response)
         else:
@@ -185,12 +274,15 @@ class YarnStatusGetter(JobMetadataGetterInterface):
                 )
             return self.parse_application_response(data=json, job_id=job_id, user_id=user_id)
 
+    # Keys that must be present in the "app" object of the YARN REST API response
+    _REQUIRED_APP_REPORT_KEYS = ("state", "finalStatus", "startedTime", "finishedTime")
+
     @staticmethod
     def _ms_epoch_to_date(epoch_millis: int) -> Union[dt.datetime, None]:
-        """Parse millisecond timestamp from app report and return as rfc3339 date (or None)"""
+        """Parse millisecond timestamp from app report and return as naive UTC datetime (or None)"""
         if epoch_millis == 0:
             return None
-        return dt.datetime.utcfromtimestamp(epoch_millis / 1000)
+        return _EPOCH + dt.timedelta(milliseconds=epoch_millis)
 
     @classmethod
     def parse_application_response(cls, data: dict, job_id: str, user_id: str) -> _JobMetadata:
@@ -204,8 +296,7 @@ class YarnStatusGetter(JobMetadataGetterInterface):
         """
 
         report = data.get("app", {})
-        required_keys = ["state", "finalStatus", "startedTime", "finishedTime"]
-        missing_keys = [k for k in required_keys if k not in report]
+        missing_keys = [k for k in cls._REQUIRED_APP_REPORT_KEYS if k not in report]
         if missing_keys:
             raise YarnAppReportParseException(
                 f"JSON response is missing following required keys: {missing_keys}, json={data}"
@@ -263,9 +354,11 @@ class YarnStatusGetter(JobMetadataGetterInterface):
     @classmethod
     def app_state_to_etl_state(cls, app_state: str) -> str:
         # TODO #610 this is just part of a temporary migration path, to be cleaned up when not necessary anymore
-        if app_state not in cls._yarn_state_to_etl_api_state:
+        etl_state = cls._yarn_state_to_etl_api_state.get(app_state)
+        if etl_state is None:
             _log.warning(f"Unhandled YARN app state mapping: {app_state}")
-        return cls._yarn_state_to_etl_api_state.get(app_state, ETL_API_STATE.UNDEFINED)
+            etl_state = ETL_API_STATE.UNDEFINED
+        return etl_state
 
 
 class K8sException(Exception):
@@ -276,30 +369,70 @@ class K8sStatusGetter(JobMetadataGetterInterface):
     """Kubernetes app status getter"""
 
     def __init__(self, kubernetes_api, prometheus_api):
+        # Local import to avoid kubernetes dependency when not necessary
+        # (done once here instead of in the per-job code path).
+        import kubernetes.client.exceptions
+
+        self._api_exception = kubernetes.client.exceptions.ApiException
         self._kubernetes_api = kubernetes_api
         self._prometheus_api = prometheus_api
+        self._namespace = ConfigParams().pod_namespace
+        # SparkApplication objects (keyed by name) fetched in bulk with `preload`
+        self._app_objects: Dict[str, dict] = {}
+        # Usage of finished apps (keyed by app id), to avoid querying Prometheus again for apps that are revisited
+        self._usage_cache = TtlCache(default_ttl=USAGE_CACHE_TTL)
+
+    def preload(self, app_ids: List[str]) -> None:
+        """List the SparkApplications with a single request, instead of getting each app separately."""
+        self._app_objects = {}
+        if not app_ids:
+            return
+        try:
+            listing = self._kubernetes_api.list_namespaced_custom_object(
+                group="sparkoperator.k8s.io",
+                version="v1beta2",
+                namespace=self._namespace,
+                plural="sparkapplications",
+            )
+        except Exception as e:
+            _log.warning(f"Failed to list SparkApplications, falling back on per app requests: {type(e).__name__}: {e}")
+            return
+
+        wanted = set(app_ids)
+        for item in listing.get("items", []):
+            name = item.get("metadata", {}).get("name")
+            if name in wanted:
+                self._app_objects[name] = item
+        _log.debug(f"Preloaded {len(self._app_objects)} of {len(wanted)} SparkApplications")
+
+    def _get_app_object(self, app_id: str) -> dict:
+        metadata = self._app_objects.pop(app_id, None)
+        if metadata is not None:
+            return metadata
 
-    def get_job_metadata(self, job_id: str, user_id: str, app_id: str) -> _JobMetadata:
-        # Local import to avoid kubernetes dependency when not necessary
-        import kubernetes.client.exceptions
         try:
-            metadata = self._kubernetes_api.get_namespaced_custom_object(
+            return self._kubernetes_api.get_namespaced_custom_object(
                 group="sparkoperator.k8s.io",
                 version="v1beta2",
-                namespace=ConfigParams().pod_namespace,
+                namespace=self._namespace,
                 plural="sparkapplications",
                 name=app_id,
             )
-        except kubernetes.client.exceptions.ApiException as e:
+        except self._api_exception as e:
             if e.status == 404:
                 # TODO: more precise checking that it was indeed the app that was not found (instead of k8s api itself).
                 raise AppNotFound() from e
             raise
 
-        if "status" in metadata:
-            app_state = metadata["status"]["applicationState"]["state"]
-            if "FAILED" == app_state and "errorMessage" in metadata["status"]["applicationState"]:
-                msg = metadata["status"]["applicationState"]["errorMessage"]
+    def get_job_metadata(self, job_id: str, user_id: str, app_id: str) -> _JobMetadata:
+        metadata = self._get_app_object(app_id)
+
+        status = metadata.get("status")
+        if status is not None:
+            application_state = status["applicationState"]
+            app_state = application_state["state"]
+            msg = application_state.get("errorMessage")
+            if "FAILED" == app_state and msg is not None:
                 if "driver" in msg and "OOMKilled" in msg:
                     _log.error(
                         "Your batch job main application went out of memory, consider increasing driver-memoryOverhead."
@@ -307,18 +440,26 @@ class K8sStatusGetter(JobMetadataGetterInterface):
                 else:
                     _log.warning(f"Final application error message: {msg}")
 
-            datetime_formatter = Rfc3339(propagate_none=True)
-            start_time = datetime_formatter.parse_datetime(metadata["status"]["lastSubmissionAttemptTime"])
-            finish_time = datetime_formatter.parse_datetime(metadata["status"]["terminationTime"])
+            start_time = _parse_rfc3339(status["lastSubmissionAttemptTime"])
+            finish_time = _parse_rfc3339(status["terminationTime"])
         else:
             _log.warning("No K8s app status found, assuming new app", extra={"job_id": job_id, "user_id": user_id})
             app_state = K8S_SPARK_APP_STATE.NEW
             start_time = finish_time = None
 
         job_status = k8s_state_to_openeo_job_status(app_state)
+        # Usage is only reported for finished apps: don't query Prometheus for the others.
+        if job_status in _FINAL_JOB_STATUSES:
+            usage = self._usage_cache.get(app_id)
+            if usage is None:
+                usage = self._get_usage(app_id, start_time, finish_time, job_id, user_id)
+                if usage != _Usage():
+                    # Don't cache failed lookups: retry them next time.
+                    self._usage_cache.set(app_id, usage)
+        else:
+            usage = _Usage()
         return _JobMetadata(
-            app_state=app_state, status=job_status, usage=self._get_usage(app_id, start_time, finish_time,
-                                                                          job_id, user_id),
+            app_state=app_state, status=job_status, usage=usage,
             start_time=start_time, finish_time=finish_time
         )
 
@@ -379,9 +520,11 @@ class K8sStatusGetter(JobMetadataGetterInterface):
     @classmethod
     def app_state_to_etl_state(cls, app_state: str) -> str:
         # TODO #610 this is just part of a temporary migration path, to be cleaned up when not necessary anymore
-        if app_state not in cls._k8s_state_to_etl_api_state:
+        etl_state = cls._k8s_state_to_etl_api_state.get(app_state)
+        if etl_state is None:
             _log.warning(f"Unhandled K8s app state mapping: {app_state}")
-        return cls._k8s_state_to_etl_api_state.get(app_state, ETL_API_STATE.UNDEFINED)
+            etl_state = ETL_API_STATE.UNDEFINED
+        return etl_state
 
 
 class JobTracker:
@@ -393,9 +536,15 @@ class JobTracker:
         keytab: str,
         job_costs_calculator: JobCostsCalculator = noJobCostsCalculator,
         output_root_dir: Optional[Union[str, Path]] = None,
-        elastic_job_registry: Optional[ElasticJobRegistry] = None
+        elastic_job_registry: Optional[ElasticJobRegistry] = None,
+        parallelism: int = 1,
     ):
+        """
+        :param parallelism: number of jobs to sync concurrently
+            (syncing a job is mostly waiting on YARN/Kubernetes, the job registries, ...)
+        """
         self._app_state_getter = app_state_getter
+        self._parallelism = parallelism
         self._job_costs_calculator = job_costs_calculator
         # TODO: inject GpsBatchJobs (instead of constructing it here and requiring all its constructor args to be present)
         #       Also note that only `load_results_metadata` is actually used, so dragging a complete GpsBatchJobs might actually be overkill in the first place.
@@ -408,6 +557,8 @@ class JobTracker:
             output_root_dir=output_root_dir,
             elastic_job_registry=elastic_job_registry,
         )
+        # Results metadata of jobs that reached a final status, to avoid reading it again for jobs that are revisited
+        self._results_metadata_cache = TtlCache(default_ttl=RESULTS_METADATA_CACHE_TTL)
         self._double_job_registry = DoubleJobRegistry(
             zk_job_registry_factory=(lambda: zk_job_registry) if zk_job_registry else None,
             elastic_job_registry=elastic_job_registry,
@@ -419,42 +570,79 @@ class JobTracker:
             name="JobTracker.update_statuses stats", report=_log.info
         ) as stats, TimingLogger("JobTracker.update_statuses", logger=_log.info):
 
-            jobs_to_track = double_job_registry.get_active_jobs()
+            jobs_to_track = list(double_job_registry.get_active_jobs())
 
-            for job_info in jobs_to_track:
-                stats["collected jobs"] += 1
-                if not (
-                    isinstance(job_info, dict)
-                    and job_info.get("job_id")
-                    and job_info.get("user_id")
-                ):
-                    _log.error(
-                        f"Invalid job info: {repr_truncate(job_info, width=200)}"
-                    )
-                    stats["invalid job_info"] += 1
-                    continue
-
-                job_id = job_info["job_id"]
-                user_id = job_info["user_id"]
-                application_id = job_info["application_id"]
-
-                try:
-                    self._sync_job_status(
-                        job_id=job_id,
-                        user_id=user_id,
-                        application_id=application_id,
-                        job_info=job_info,
-                        double_job_registry=double_job_registry,
-                        stats=stats,
-                    )
-                except Exception as e:
-                    _log.exception(
-                        f"Failed status sync for {job_id=}: unexpected {type(e).__name__}: {e}",
-                        extra={"job_id": job_id, "user_id": user_id},
+            self._app_state_getter.preload(
+                app_ids=[
+                    job_info["application_id"]
+                    for job_info in jobs_to_track
+                    if isinstance(job_info, dict) and job_info.get("application_id")
+                ]
+            )
+
+            if self._parallelism > 1 and len(jobs_to_track) > 1:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self._parallelism) as executor:
+                    # Each job gets its own stats counter, which is merged in this thread.
+                    futures = [
+                        executor.submit(
+                            self._sync_job,
+                            job_info=job_info,
+                            double_job_registry=double_job_registry,
+                            stats=collections.Counter(),
+                            fail_fast=fail_fast,
+                        )
+                        for job_info in jobs_to_track
+                    ]
+                    for future in concurrent.futures.as_completed(futures):
+                        stats.update(future.result())
+            else:
+                for job_info in jobs_to_track:
+                    self._sync_job(
+                        job_info=job_info, double_job_registry=double_job_registry, stats=stats, fail_fast=fail_fast
                     )
-                    stats["failed sync"] += 1
-                    if fail_fast:
-                        raise
+
+    def _sync_job(
+        self,
+        job_info: dict,
+        double_job_registry: DoubleJobRegistry,
+        stats: collections.Counter,
+        fail_fast: bool = False,
+    ) -> collections.Counter:
+        """Validate job info and sync the job's status, without failing on unexpected errors (unless `fail_fast`)"""
+        stats["collected jobs"] += 1
+        if not (
+            isinstance(job_info, dict)
+            and job_info.get("job_id")
+            and job_info.get("user_id")
+        ):
+            _log.error(
+                f"Invalid job info: {repr_truncate(job_info, width=200)}"
+            )
+            stats["invalid job_info"] += 1
+            return stats
+
+        job_id = job_info["job_id"]
+        user_id = job_info["user_id"]
+        application_id = job_info["application_id"]
+
+        try:
+            self._sync_job_status(
+                job_id=job_id,
+                user_id=user_id,
+                application_id=application_id,
+                job_info=job_info,
+                double_job_registry=double_job_registry,
+                stats=stats,
+            )
+        except Exception as e:
+            _log.exception(
+                f"Failed status sync for {job_id=}: unexpected {type(e).__name__}: {e}",
+                extra={"job_id": job_id, "user_id": user_id},
+            )
+            stats["failed sync"] += 1
+            if fail_fast:
+                raise
+        return stats
 
     def _sync_job_status(
         self,
@@ -472,7 +660,8 @@ class JobTracker:
         assert application_id == job_info.get("application_id")
         previous_status = job_info.get("status")
         log.debug(
-            f"About to sync status for {job_id=} {user_id=} {application_id=} {previous_status=}"
+            "About to sync status for job_id=%r user_id=%r application_id=%r previous_status=%r",
+            job_id, user_id, application_id, previous_status,
         )
         stats[f"job with {previous_status=}"] += 1
 
@@ -500,18 +689,14 @@ class JobTracker:
             stats["status same"] += 1
             stats[f"status same {job_metadata.status!r}"] += 1
 
-        if job_metadata.status in {
-            JOB_STATUS.FINISHED,
-            JOB_STATUS.ERROR,
-            JOB_STATUS.CANCELED,
-        }:
+        if job_metadata.status in _FINAL_JOB_STATUSES:
             stats[f"reached final status {job_metadata.status}"] += 1
-            result_metadata = self._batch_jobs.load_results_metadata(job_id, user_id)
+            result_metadata = self._load_results_metadata(job_id=job_id, user_id=user_id)
 
             double_job_registry.remove_dependencies(job_id, user_id)
 
             # there can be duplicates if batch processes are recycled
-            dependency_sources = list(set(get_deletable_dependency_sources(job_info)))
+            dependency_sources = list(dict.fromkeys(get_deletable_dependency_sources(job_info)))
 
             if dependency_sources:
                 async_task.schedule_delete_batch_process_dependency_sources(
@@ -556,7 +741,7 @@ class JobTracker:
 
             try:
                 job_costs = self._job_costs_calculator.calculate_costs(costs_details)
-                _log.debug(f"job_costs: calculated {job_costs}")
+                _log.debug("job_costs: calculated %s", job_costs)
                 stats["job_costs: calculated"] += 1
                 stats[f"job_costs: nonzero={isinstance(job_costs, float) and job_costs>0}"] += 1
                 # TODO: skip patching the job znode and read from this file directly?
@@ -566,20 +751,47 @@ class JobTracker:
                 job_costs = None
 
             total_usage = dict_merge_recursive(job_metadata.usage.to_dict(), result_metadata.get("usage", {}))
+            # Store results metadata and final status together (one update instead of two).
             double_job_registry.set_results_metadata(job_id, user_id, costs=job_costs,
                                                      usage=self._to_jsonable(dict(total_usage)),
-                                                     results_metadata=self._to_jsonable(result_metadata))
+                                                     results_metadata=self._to_jsonable(result_metadata),
+                                                     status=job_metadata.status,
+                                                     started=_rfc3339.datetime(job_metadata.start_time),
+                                                     finished=_rfc3339.datetime(job_metadata.finish_time))
+            return
 
-        datetime_formatter = Rfc3339(propagate_none=True)
+        started = _rfc3339.datetime(job_metadata.start_time)
+        finished = _rfc3339.datetime(job_metadata.finish_time)
+
+        # Tracked job info comes from the ZkJobRegistry (when enabled): only that registry can be skipped
+        # when nothing changed. The EJR is always written to, so it is healed when it drifted.
+        zk_unchanged = (
+            double_job_registry.zk_job_registry is not None
+            and (previous_status, job_info.get("started"), job_info.get("finished"))
+            == (job_metadata.status, started, finished)
+        )
+        if zk_unchanged:
+            stats["skip zk: status unchanged"] += 1
 
         double_job_registry.set_status(
             job_id=job_id,
             user_id=user_id,
             status=job_metadata.status,
-            started=datetime_formatter.datetime(job_metadata.start_time),
-            finished=datetime_formatter.datetime(job_metadata.finish_time),
+            started=started,
+            finished=finished,
+            skip_zk=zk_unchanged,
         )
 
+    def _load_results_metadata(self, job_id: str, user_id: str) -> dict:
+        key = (job_id, user_id)
+        result_metadata = self._results_metadata_cache.get(key)
+        if result_metadata is None:
+            result_metadata = self._batch_jobs.load_results_metadata(job_id, user_id)
+            if result_metadata:
+                # Don't cache missing metadata: it might still be written.
+                self._results_metadata_cache.set(key, result_metadata)
+        return result_metadata
+
     @staticmethod
     def _to_jsonable_float(x: float) -> Union[float, str]:
         return x if isfinite(x) else str(x)
@@ -600,13 +812,14 @@ class CliApp:
     def main(self, *, args: Optional[List[str]] = None):
 
         args = self.parse_cli_args(args=args)
+        config_params = ConfigParams()
 
         if args.run_id:
             GlobalExtraLoggingFilter.set("run_id", args.run_id)
 
         rotating_log = args.rotating_log
 
-        if not rotating_log and not ConfigParams().is_kube_deploy and Path("logs").is_dir():
+        if not rotating_log and not config_params.is_kube_deploy and Path("logs").is_dir():
             # TODO: eliminate this temporary fallback
             rotating_log = f"logs/job_tracker_python.log"
 
@@ -616,7 +829,7 @@ class CliApp:
         )
 
         _log.info(f"job_tracker_v2 cli {args=}")
-        _log.info(f"job_tracker_v2 cli {ConfigParams()=!s}")
+        _log.info(f"job_tracker_v2 cli {config_params=!s}")
         package_versions = openeo_driver.utils.get_package_versions(
             ["openeo", "openeo_driver", "openeo-geopyspark", "kubernetes"]
         )
@@ -643,16 +856,19 @@ class CliApp:
                 app_cluster = args.app_cluster
                 if app_cluster == "auto":
                     # TODO: eliminate (need for) auto-detection.
-                    app_cluster = "k8s" if ConfigParams().is_kube_deploy else "yarn"
+                    app_cluster = "k8s" if config_params.is_kube_deploy else "yarn"
                 if app_cluster == "yarn":
                     app_state_getter = YarnStatusGetter(
-                        yarn_api_base_url=ConfigParams().yarn_rest_api_base_url,
+                        yarn_api_base_url=config_params.yarn_rest_api_base_url,
                         auth=requests_gssapi.HTTPSPNEGOAuth(
                             mutual_authentication=requests_gssapi.REQUIRED
                         ),
                     )
                 elif app_cluster == "k8s":
-                    app_state_getter = K8sStatusGetter(kube_client("CustomObject"), Prometheus(config.prometheus_api))
+                    app_state_getter = K8sStatusGetter(
+                        kube_client("CustomObject"),
+                        Prometheus(config.prometheus_api, requests_session=requests_session),
+                    )
                 elif app_cluster == "broken-dummy":
                     raise RuntimeError("Broken dummy")
                 else:
@@ -666,7 +882,8 @@ class CliApp:
                     principal=args.principal,
                     keytab=args.keytab,
                     elastic_job_registry=elastic_job_registry,
-                    job_costs_calculator=job_costs_calculator
+                    job_costs_calculator=job_costs_calculator,
+                    parallelism=args.parallelism,
                 )
                 job_tracker.update_statuses(fail_fast=args.fail_fast)
             except Exception as e:
@@ -696,6 +913,12 @@ class CliApp:
             default=False,
             help="Stop immediately on unexpected errors while tracking a certain job, instead of skipping to next job.",
         )
+        parser.add_argument(
+            "--parallelism",
+            type=int,
+            default=1,
+            help="Number of jobs to sync concurrently.",
+        )
         parser.add_argument(
             "--app-cluster",
             choices=[
@@ -276,8 +276,12 @@ class GeoPySparkLayerCatalog(CollectionCatalog):
                 else:
                     target_epsg_code = pyproj.CRS.from_user_input(load_params.target_crs).to_epsg()
 
-        projected_polygons_native_crs = (getattr(getattr(jvm.org.openeo.geotrellis, "ProjectedPolygons$"), "MODULE$")
-                                         .reproject(projected_polygons, target_epsg_code))
+        if not geometries and isinstance(srs, str) and srs.upper() == f"EPSG:{target_epsg_code}":
+            # Polygons were built from the extent in `srs`: reprojecting would be a no-op.
+            projected_polygons_native_crs = projected_polygons
+        else:
+            projected_polygons_native_crs = (getattr(getattr(jvm.org.openeo.geotrellis, "ProjectedPolygons$"), "MODULE$")
+                                             .reproject(projected_polygons, target_epsg_code))
         logger.debug(projected_polygons_native_crs)
         logger.debug(projected_polygons_native_crs.geometries())
         logger.debug(projected_polygons_native_crs.extent())
@@ -725,13 +729,15 @@ class GeoPySparkLayerCatalog(CollectionCatalog):
             temporal_tiled_raster_layer = jvm.geopyspark.geotrellis.TemporalTiledRasterLayer
             option = jvm.scala.Option
 
-            levels = {
-                pyramid.apply(index)._1(): geopyspark.TiledRasterLayer(
+            # Fetch each (zoom, rdd) tuple once: every `apply`/`_1`/`_2` is a Py4J round trip.
+            levels = {}
+            for index in range(0, pyramid.size()):
+                pair = pyramid.apply(index)
+                zoom = pair._1()
+                levels[zoom] = geopyspark.TiledRasterLayer(
                     geopyspark.LayerType.SPACETIME,
-                    temporal_tiled_raster_layer(option.apply(pyramid.apply(index)._1()), pyramid.apply(index)._2())
+                    temporal_tiled_raster_layer(option.apply(zoom), pair._2())
                 )
-                for index in range(0, pyramid.size())
-            }
 
         if single_level:
             max_zoom = max(levels.keys())
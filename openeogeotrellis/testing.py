@@ -1,10 +1,11 @@
 """
 Reusable helpers, functions, classes, fixtures for testing purposes
 """
+import copy
 import json
 import uuid
 from pathlib import Path
-from typing import Dict, Iterator, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from unittest import mock
 
 import attrs
@@ -59,6 +60,58 @@ class _ZNode:
             yield from child.dump(root=root / name)
 
 
+class _AsyncResultMock:
+    """Already resolved stand-in for Kazoo's `IAsyncResult`"""
+
+    def __init__(self, value: Any = None, exception: Optional[Exception] = None):
+        self._value = value
+        self._exception = exception
+
+    @classmethod
+    def from_call(cls, f: Callable, *args, **kwargs) -> "_AsyncResultMock":
+        try:
+            return cls(value=f(*args, **kwargs))
+        except Exception as e:
+            return cls(exception=e)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        if self._exception:
+            raise self._exception
+        return self._value
+
+
+class _TransactionMock:
+    """Stand-in for Kazoo's `TransactionRequest`: all operations succeed, or none are applied."""
+
+    def __init__(self, client: "KazooClientMock"):
+        self._client = client
+        self._operations: List[Tuple[str, tuple]] = []
+
+    def create(self, path: Union[str, Path], value: bytes = b""):
+        self._operations.append(("create", (path, value)))
+
+    def delete(self, path: Union[str, Path], version: int = -1):
+        self._operations.append(("delete", (path, version)))
+
+    def set_data(self, path: Union[str, Path], value: bytes, version: int = -1):
+        self._operations.append(("set", (path, value, version)))
+
+    def commit(self) -> list:
+        backup = copy.deepcopy(self._client.root)
+        results = []
+        for name, args in self._operations:
+            try:
+                results.append(getattr(self._client, name)(*args))
+            except kazoo.exceptions.KazooException as e:
+                # Like Kazoo/ZooKeeper: failed operation gets its own error, the others a `RolledBackError`
+                self._client.root = backup
+                return [
+                    e if i == len(results) else kazoo.exceptions.RolledBackError()
+                    for i in range(len(self._operations))
+                ]
+        return results
+
+
 class KazooClientMock:
     """Simple mock for KazooClient that stores data in memory"""
 
@@ -118,10 +171,20 @@ class KazooClientMock:
         znode = self._get(path)
         return znode.value, znode.stat
 
-    def set(self, path: Union[str, Path], value: bytes, version: int = -1):
+    def get_async(self, path: Union[str, Path]) -> "_AsyncResultMock":
+        return _AsyncResultMock.from_call(self.get, path)
+
+    def get_children_async(self, path: Union[str, Path]) -> "_AsyncResultMock":
+        return _AsyncResultMock.from_call(self.get_children, path)
+
+    def set(self, path: Union[str, Path], value: bytes, version: int = -1) -> _ZNodeStat:
         znode = self._get(path).assert_version(version)
         znode.value = value
         znode.stat.bump_version()
+        return znode.stat
+
+    def transaction(self) -> "_TransactionMock":
+        return _TransactionMock(client=self)
 
     def delete(self, path: Union[str, Path], version: int = -1):
         path = Path(path)
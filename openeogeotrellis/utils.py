@@ -409,16 +409,22 @@ def single_value(xs):
     raise ValueError(f"distinct values in {xs}")
 
 
-def add_permissions(path: Path, mode: int):
-    # TODO: accept PathLike etc as well
+def add_permissions(path: Union[str, os.PathLike], mode: int):
     # TODO: maybe umask is a better/cleaner option
-    if path.exists():
+    path = os.fspath(path)
+
+    def add_mode(p: str, current_permission_bits: int):
+        if current_permission_bits | mode != current_permission_bits:
+            os.chmod(p, current_permission_bits | mode)
+
+    try:
         current_permission_bits = os.stat(path).st_mode
-        os.chmod(path, current_permission_bits | mode)
+    except FileNotFoundError:
+        with os.scandir(os.path.dirname(path) or os.curdir) as entries:
+            for entry in entries:
+                add_mode(entry.path, entry.stat().st_mode)
     else:
-        for p in path.parent.glob('*'):
-            current_permission_bits = os.stat(p).st_mode
-            p.chmod(current_permission_bits | mode)
+        add_mode(path, current_permission_bits)
 
 
 def ensure_executor_logging(f) -> Callable:
@@ -183,6 +183,23 @@ def test_instant_ms_to_day():
     assert _instant_ms_to_day(1479249799770) == datetime.datetime(2016, 11, 15)
 
 
+@pytest.mark.parametrize(
+    ["instant", "expected"],
+    [
+        (0, datetime.datetime(1970, 1, 1)),
+        (1479254399999, datetime.datetime(2016, 11, 15)),
+        (1479254400000, datetime.datetime(2016, 11, 16)),
+        (-1, datetime.datetime(1969, 12, 31)),
+        (-86400000, datetime.datetime(1969, 12, 31)),
+        (-86400001, datetime.datetime(1969, 12, 30)),
+        (-1479249799770, datetime.datetime(1923, 2, 16)),
+    ],
+)
+def test_instant_ms_to_day_matches_utcfromtimestamp(instant, expected):
+    legacy = datetime.datetime(*(datetime.datetime.utcfromtimestamp(instant // 1000).timetuple()[:3]))
+    assert _instant_ms_to_day(instant) == legacy == expected
+
+
 class TestOrfeoPipeline:
     def setup_method(self, method):
         self.old_openeo_batch_job_id = os.environ.get("OPENEO_BATCH_JOB_ID")
@@ -64,3 +64,7 @@ def test_read_single_edge():
     result = read_product((product_dir, tiles), SLSTR_PRODUCT_TYPE, ["LST_in:LST", "geometry_tn:solar_zenith_tn"], 1024, True)
 
     assert len(result) == 0
+
+
+def test_instant_ms_to_hour():
+    assert _instant_ms_to_hour(1479249799770) == datetime(2016, 11, 15, 22)
@@ -1,5 +1,6 @@
 import json
 import logging
+import math
 import shutil
 import tempfile
 from pathlib import Path
@@ -17,9 +18,9 @@ from openeo_driver.save_result import ImageCollectionResult
 from openeo_driver.testing import DictSubSet
 from openeo_driver.utils import read_json
 from openeogeotrellis._version import __version__
-from openeogeotrellis.deploy.batch_job import run_job
+from openeogeotrellis.deploy.batch_job import run_job, _parse
 from openeogeotrellis.deploy.batch_job_metadata import extract_result_metadata, _convert_asset_outputs_to_s3_urls, \
-    _get_tracker, _convert_job_metadatafile_outputs_to_s3_urls
+    _get_tracker, _convert_job_metadatafile_outputs_to_s3_urls, _write_json_atomically
 from openeogeotrellis.integrations.gdal import _get_projection_extension_metadata, AssetRasterMetadata, \
     parse_gdal_raster_metadata, read_gdal_raster_metadata, BandStatistics
 from openeogeotrellis.utils import get_jvm, to_s3_url
@@ -1665,3 +1666,25 @@ def test_convert_job_metadatafile_outputs_to_s3_urls(tmp_path):
 
     assert converted_metadata['assets']['openEO_2017-11-21Z.tif']["href"].startswith("s3://")
     assert converted_metadata['assets']['a-second-asset-file.tif']["href"].startswith("s3://")
+
+
+def test_parse_job_specification_with_nan(tmp_path):
+    job_specification_file = tmp_path / "job_specification.json"
+    with open(job_specification_file, "wt") as f:
+        json.dump({"process_graph": {}, "job_options": {"nodata": float("nan"), "big": 2 ** 70}}, f)
+
+    job_specification = _parse(str(job_specification_file))
+
+    assert math.isnan(job_specification["job_options"]["nodata"])
+    assert job_specification["job_options"]["big"] == 2 ** 70
+
+
+def test_write_json_atomically_failure_keeps_original_file(tmp_path):
+    metadata_file = tmp_path / "job_metadata.json"
+    _write_json_atomically(metadata_file, {"status": "running"})
+
+    with pytest.raises(TypeError):
+        _write_json_atomically(metadata_file, {"status": object()})
+
+    assert json.loads(metadata_file.read_text()) == {"status": "running"}
+    assert [p.name for p in tmp_path.iterdir()] == ["job_metadata.json"]
@@ -1,3 +1,7 @@
+from unittest import mock
+
+import requests
+
 from openeogeotrellis.integrations.prometheus import Prometheus
 
 
@@ -5,3 +9,17 @@ def test_endpoint_property():
     prometheus = Prometheus("https://prometheus.example.org")
 
     assert prometheus.endpoint == "https://prometheus.example.org"
+
+
+def test_query_with_requests_session(requests_mock):
+    requests_mock.get(
+        "https://prometheus.example.org/query",
+        json={"status": "success", "data": {"result": [{"value": [1700000000, "123.5"]}]}},
+    )
+    session = requests.Session()
+    prometheus = Prometheus("https://prometheus.example.org", requests_session=session)
+
+    with mock.patch.object(session, "get", wraps=session.get) as get:
+        assert prometheus.get_cpu_usage("job-123") == 123.5
+    assert get.call_count == 1
+    assert get.call_args.kwargs["timeout"] > 0
@@ -21,3 +21,28 @@ def test_collect_unique_process_ids():
         'filter_bands',
         'save_result'
     }
+
+
+def test_collect_unique_process_ids_visits_shared_nodes_once():
+    process_graph = {
+        "load": {"process_id": "load_collection", "arguments": {"id": "S2"}},
+        "b1": {"process_id": "filter_bands", "arguments": {"data": {"from_node": "load"}, "bands": ["B04"]}},
+        "b2": {"process_id": "filter_bands", "arguments": {"data": {"from_node": "load"}, "bands": ["B08"]}},
+        "merge": {
+            "process_id": "merge_cubes",
+            "arguments": {"cube1": {"from_node": "b1"}, "cube2": {"from_node": "b2"}},
+            "result": True,
+        },
+    }
+
+    entered = []
+
+    class CountingVisitor(CollectUniqueProcessIdsVisitor):
+        def enterProcess(self, process_id, arguments, namespace):
+            entered.append(process_id)
+            super().enterProcess(process_id, arguments, namespace)
+
+    collector = CountingVisitor().accept_process_graph(process_graph)
+
+    assert collector.process_ids == {"load_collection", "filter_bands", "merge_cubes"}
+    assert sorted(entered) == ["filter_bands", "filter_bands", "load_collection", "merge_cubes"]
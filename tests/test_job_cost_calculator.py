@@ -110,3 +110,30 @@ class TestDynamicEtlApiJobCostCalculator:
             costs = calculator.calculate_costs(costs_details)
             assert costs == 2100.0
             assert (mock_alt.call_count, mock_planb.call_count) == (1, 1)
+
+    def test_calculate_cost_added_value(self, custom_etl_api_config, requests_mock, oidc_mock):
+        with gps_config_overrides(etl_api_config=custom_etl_api_config):
+            calculator = DynamicEtlApiJobCostCalculator()
+
+            requests_mock.post("https://etl-alt.test/resources", json=[{"cost": 10}])
+
+            def post_added_value(request, context):
+                assert request.headers["Authorization"] == "Bearer " + oidc_mock.state["access_token"]
+                return [{"cost": {"ndvi": 1, "sar_backscatter": 20, "atmospheric_correction": 300}[request.json()["service"]]}]
+
+            mock_added_value = requests_mock.post("https://etl-alt.test/addedvalue", json=post_added_value)
+
+            costs_details = CostsDetails(
+                job_id="job-123",
+                user_id="john",
+                execution_id="exec123",
+                job_options={"my_etl": "alt"},
+                app_state_etl_api_deprecated="FINISHED",
+                job_status="finished",
+                area_square_meters=1000.0,
+                unique_process_ids=["load_collection", "ndvi", "sar_backscatter", "atmospheric_correction"],
+            )
+            costs = calculator.calculate_costs(costs_details)
+            assert costs == 331.0
+            # "load_collection" is not billable
+            assert mock_added_value.call_count == 3
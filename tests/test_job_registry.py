@@ -816,6 +816,39 @@ class TestDoubleJobRegistry:
             }
         )
 
+    def test_set_results_metadata_with_status(self, double_jr, zk_client, memory_jr, time_machine):
+        time_machine.move_to("2023-02-15T17:17:17Z")
+        with double_jr:
+            double_jr.create_job(job_id="j-123", user_id="john", process=self.DUMMY_PROCESS)
+            double_jr.set_results_metadata(job_id="j-123", user_id="john", costs=1.23,
+                                           usage={"cpu": {"unit": "cpu-seconds", "value": 32}},
+                                           results_metadata={"epsg": 4326},
+                                           status=JOB_STATUS.FINISHED,
+                                           started="2023-02-15T17:00:00Z", finished="2023-02-15T17:10:00Z")
+
+        # Final status: job is marked as done in ZooKeeper
+        assert zk_client.get_json_decoded("/openeo.test/jobs/done/john/j-123") == DictSubSet(
+            {
+                "status": "finished",
+                "started": "2023-02-15T17:00:00Z",
+                "finished": "2023-02-15T17:10:00Z",
+                "updated": "2023-02-15T17:17:17Z",
+                "costs": 1.23,
+                "usage": {"cpu": {"unit": "cpu-seconds", "value": 32}},
+                "epsg": 4326,
+            }
+        )
+
+        assert memory_jr.db["j-123"] == DictSubSet(
+            {
+                "status": "finished",
+                "started": "2023-02-15T17:00:00Z",
+                "finished": "2023-02-15T17:10:00Z",
+                "costs": 1.23,
+                "results_metadata": {"epsg": 4326},
+            }
+        )
+
     @pytest.mark.parametrize(
         ["with_zk", "with_ejr"],
         [
@@ -910,3 +943,4 @@ class TestDoubleJobRegistry:
 
         active_job_ids = set(job["job_id"] for job in active_jobs)
         assert active_job_ids == {"j-456"}
+        assert not any("specification" in job for job in active_jobs)
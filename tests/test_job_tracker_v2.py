@@ -28,6 +28,7 @@ from openeogeotrellis.job_tracker_v2 import (
     K8sStatusGetter,
     YarnAppReportParseException,
     YarnStatusGetter,
+    _parse_rfc3339,
 )
 from openeogeotrellis.testing import KazooClientMock, gps_config_overrides
 from openeogeotrellis.utils import json_write
@@ -251,6 +252,16 @@ class YarnMock:
                 text=response_call_back,
             )
 
+            def list_apps_call_back(request, context):
+                context.status_code = 200
+                apps = [app.status_rest_response()["app"] for app in self.apps.values()]
+                return json.dumps({"apps": {"app": apps} if apps else None})
+
+            requests_mocker.get(
+                re.compile(f"{base_url}/ws/v1/cluster/apps(\\?.*)?$"),
+                text=list_apps_call_back,
+            )
+
             yield
 
 @dataclass
@@ -302,7 +313,19 @@ class KubernetesMock:
             raise kubernetes.client.exceptions.ApiException(
                 status=404, reason="Not Found"
             )
-        app = self.apps[name]
+        return self._app_object(self.apps[name])
+
+    def list_namespaced_custom_object(self, **kwargs) -> dict:
+        return {
+            "items": [
+                dict(self._app_object(app), metadata={"name": name})
+                for name, app in self.apps.items()
+                if name not in self.corrupt_app_ids
+            ]
+        }
+
+    @staticmethod
+    def _app_object(app: KubernetesAppInfo) -> dict:
         if app.state == K8S_SPARK_APP_STATE.NEW:
             # TODO: is this the actual behavior for "new" apps: no "status" in response?
             return {}
@@ -571,6 +594,38 @@ class TestYarnJobTracker:
 
         assert caplog.record_tuples == []
 
+    def test_yarn_zookeeper_skip_unchanged_status(
+        self, zk_client, zk_job_registry, yarn_mock, job_tracker, elastic_job_registry, time_machine
+    ):
+        time_machine.move_to("2022-12-14T12:00:00Z", tick=False)
+        job_id = "job-123"
+        user_id = "john"
+        zk_job_registry.register(
+            job_id=job_id,
+            user_id=user_id,
+            api_version="1.2.3",
+            specification=ZkJobRegistry.build_specification_dict(process_graph=DUMMY_PG_1),
+        )
+        zk_job_registry.set_application_id(job_id=job_id, user_id=user_id, application_id="app-123")
+        elastic_job_registry.create_job(job_id=job_id, user_id=user_id, process=DUMMY_PROCESS_1)
+        yarn_mock.submit(app_id="app-123", state=YARN_STATE.RUNNING)
+
+        def zk_version() -> int:
+            _, stat = zk_client.get("/openeo.test/jobs/ongoing/john/job-123")
+            return stat.version
+
+        time_machine.coordinates.shift(70)
+        job_tracker.update_statuses()
+        assert zk_job_registry.get_job(job_id=job_id, user_id=user_id) == DictSubSet({"status": "running"})
+        assert elastic_job_registry.db[job_id] == DictSubSet({"status": "running", "updated": "2022-12-14T12:01:10Z"})
+        version = zk_version()
+
+        # Nothing changed: Zookeeper is not written to, the EJR still is
+        time_machine.coordinates.shift(70)
+        job_tracker.update_statuses()
+        assert zk_version() == version
+        assert elastic_job_registry.db[job_id] == DictSubSet({"status": "running", "updated": "2022-12-14T12:02:20Z"})
+
     def test_yarn_zookeeper_lost_yarn_app(
         self,
         zk_job_registry,
@@ -692,6 +747,58 @@ class TestYarnJobTracker:
             )
         ]
 
+    def test_yarn_zookeeper_parallelism(
+        self,
+        zk_job_registry,
+        yarn_mock,
+        elastic_job_registry,
+        batch_job_output_root,
+        job_costs_calculator,
+        caplog,
+    ):
+        caplog.set_level(logging.INFO)
+        job_tracker = JobTracker(
+            app_state_getter=YarnStatusGetter(ConfigParams().yarn_rest_api_base_url),
+            zk_job_registry=zk_job_registry,
+            principal="john@EXAMPLE.TEST",
+            keytab="test/openeo.keytab",
+            job_costs_calculator=job_costs_calculator,
+            output_root_dir=batch_job_output_root,
+            elastic_job_registry=elastic_job_registry,
+            parallelism=4,
+        )
+
+        for j in range(1, 7):
+            job_id, user_id, app_id = f"job-{j}", f"user{j}", f"app-{j}"
+            zk_job_registry.register(
+                job_id=job_id,
+                user_id=user_id,
+                api_version="1.2.3",
+                specification=ZkJobRegistry.build_specification_dict(
+                    process_graph=DUMMY_PG_1, job_options=DUMMY_JOB_OPTIONS
+                ),
+            )
+            zk_job_registry.set_application_id(job_id=job_id, user_id=user_id, application_id=app_id)
+            elastic_job_registry.create_job(
+                job_id=job_id, user_id=user_id, process=DUMMY_PROCESS_1, job_options=DUMMY_JOB_OPTIONS
+            )
+            if j % 2:
+                yarn_mock.submit(app_id=app_id, state=YARN_STATE.RUNNING)
+            else:
+                yarn_mock.corrupt_app_ids.add(app_id)
+
+        job_tracker.update_statuses()
+
+        for j in range(1, 7):
+            expected_status = "running" if j % 2 else "created"
+            assert zk_job_registry.get_job(job_id=f"job-{j}", user_id=f"user{j}") == DictSubSet(
+                {"status": expected_status}
+            )
+            assert elastic_job_registry.db[f"job-{j}"] == DictSubSet(status=expected_status)
+
+        [stats] = _extract_update_statuses_stats(caplog)
+        assert stats == DictSubSet({"collected jobs": 6, "failed sync": 3})
+
     def test_yarn_zookeeper_yarn_failed_to_launch_container(
         self,
         zk_job_registry,
@@ -841,6 +948,7 @@ class TestYarnJobTracker:
             "new metadata": 2,
             "status same": 2,
             "status same 'running'": 2,
+            "skip zk: status unchanged": 2,
         }
 
     @pytest.mark.parametrize("job_options", [None, DUMMY_JOB_OPTIONS])
@@ -935,6 +1043,22 @@ class TestYarnJobTracker:
 
         assert caplog.record_tuples == []
 
+    def test_load_results_metadata_cached(self, job_tracker):
+        with mock.patch.object(
+            job_tracker._batch_jobs, "load_results_metadata", return_value={"unique_process_ids": ["load_collection"]}
+        ) as load_results_metadata:
+            for _ in range(2):
+                assert job_tracker._load_results_metadata(job_id="job-123", user_id="john") == {
+                    "unique_process_ids": ["load_collection"]
+                }
+        assert load_results_metadata.call_count == 1
+
+    def test_load_results_metadata_missing_not_cached(self, job_tracker):
+        with mock.patch.object(job_tracker._batch_jobs, "load_results_metadata", return_value={}) as load_results_metadata:
+            for _ in range(2):
+                assert job_tracker._load_results_metadata(job_id="job-123", user_id="john") == {}
+        assert load_results_metadata.call_count == 2
+
 
 class TestYarnStatusGetter:
     def test_parse_application_response_basic(self):
@@ -1006,6 +1130,89 @@ class TestYarnStatusGetter:
         assert m_get.called
 
 
+    def test_preload(self, requests_mock):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        m_list = requests_mock.get(
+            status_getter.get_applications_url(),
+            json={
+                "apps": {
+                    "app": [
+                        fake_yarn_rest_response_json(app_id="app_1", state="RUNNING", final_status="UNDEFINED")["app"],
+                        fake_yarn_rest_response_json(app_id="app_2", state="RUNNING", final_status="UNDEFINED")["app"],
+                    ]
+                }
+            },
+        )
+        m_get = requests_mock.get(
+            status_getter.get_application_url("app_1"),
+            json=fake_yarn_rest_response_json(app_id="app_1", state="FINISHED", final_status="SUCCEEDED"),
+        )
+
+        status_getter.preload(app_ids=["app_1"])
+        assert m_list.call_count == 1
+        assert m_list.last_request.qs == {
+            "applicationtags": ["openeo"],
+            "states": ["new,new_saving,submitted,accepted,running"],
+        }
+
+        job_metadata = status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app_1")
+        assert job_metadata.status == "running"
+        assert not m_get.called
+
+        # Preloaded app reports are only used once
+        job_metadata = status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app_1")
+        assert job_metadata.status == "finished"
+        assert m_get.call_count == 1
+
+    def test_preload_not_modified(self, requests_mock):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        m_list = requests_mock.get(
+            status_getter.get_applications_url(),
+            [
+                {
+                    "json": {
+                        "apps": {
+                            "app": [
+                                fake_yarn_rest_response_json(app_id="app_1", state="RUNNING", final_status="UNDEFINED")[
+                                    "app"
+                                ],
+                            ]
+                        }
+                    },
+                    "headers": {"ETag": '"v1"'},
+                },
+                {"status_code": 304},
+            ],
+        )
+        m_get = requests_mock.get(status_getter.get_application_url("app_1"), status_code=500)
+
+        status_getter.preload(app_ids=["app_1"])
+        assert "If-None-Match" not in m_list.last_request.headers
+        job_metadata = status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app_1")
+        assert job_metadata.status == "running"
+
+        # Unchanged listing: reuse the app reports of the previous one
+        status_getter.preload(app_ids=["app_1"])
+        assert m_list.call_count == 2
+        assert m_list.last_request.headers["If-None-Match"] == '"v1"'
+        job_metadata = status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app_1")
+        assert job_metadata.status == "running"
+        assert not m_get.called
+
+    def test_preload_failure_falls_back_on_per_app_requests(self, requests_mock):
+        status_getter = YarnStatusGetter(ConfigParams().yarn_rest_api_base_url)
+        requests_mock.get(status_getter.get_applications_url(), status_code=500)
+        m_get = requests_mock.get(
+            status_getter.get_application_url("app_1"),
+            json=fake_yarn_rest_response_json(app_id="app_1", state="FINISHED", final_status="SUCCEEDED"),
+        )
+
+        status_getter.preload(app_ids=["app_1"])
+        job_metadata = status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app_1")
+        assert job_metadata.status == "finished"
+        assert m_get.call_count == 1
+
+
 class TestK8sJobTracker:
     @pytest.fixture
     def k8s_mock(self) -> KubernetesMock:
@@ -1603,6 +1810,19 @@ class TestK8sJobTracker:
         assert caplog.record_tuples == []
 
 
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        ("2022-12-14T12:34:56Z", dt.datetime(2022, 12, 14, 12, 34, 56)),
+        ("2022-12-14T12:34:56.789Z", dt.datetime(2022, 12, 14, 12, 34, 56, 789000)),
+        ("2022-12-14T12:34:56.7Z", dt.datetime(2022, 12, 14, 12, 34, 56, 700000)),
+        (None, None),
+    ],
+)
+def test_parse_rfc3339(value, expected):
+    assert _parse_rfc3339(value) == expected
+
+
 class TestK8sStatusGetter:
     def test_cpu_and_memory_usage_not_in_prometheus(self, caplog):
         caplog.set_level(logging.WARNING)
@@ -1638,6 +1858,57 @@ class TestK8sStatusGetter:
         assert job_metadata.usage.cpu_seconds == 1 * 3600
         assert job_metadata.usage.mb_seconds == 2 * 3600 * 1024
 
+    def test_no_usage_for_running_app(self):
+        prometheus_mock = mock.Mock(Prometheus)
+        k8s_mock = KubernetesMock()
+        k8s_mock.submit(app_id="app-1", state=K8S_SPARK_APP_STATE.RUNNING)
+        k8s_status_getter = K8sStatusGetter(k8s_mock, prometheus_mock)
+
+        job_metadata = k8s_status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app-1")
+        assert job_metadata.status == "running"
+        assert (job_metadata.usage.cpu_seconds, job_metadata.usage.mb_seconds) == (None, None)
+        assert prometheus_mock.method_calls == []
+
+    def test_usage_cached(self):
+        prometheus_mock = mock.Mock(Prometheus)
+        prometheus_mock.endpoint = "https://prometheus.test/api/v1"
+        prometheus_mock.get_cpu_usage.return_value = 2.34 * 3600
+        prometheus_mock.get_memory_usage.return_value = 5.678 * 1024 * 1024 * 3600
+        k8s_mock = KubernetesMock()
+        k8s_mock.submit(app_id="app-1", state=K8S_SPARK_APP_STATE.RUNNING)
+        k8s_mock.apps["app-1"].set_completed()
+        k8s_status_getter = K8sStatusGetter(k8s_mock, prometheus_mock)
+
+        for _ in range(2):
+            job_metadata = k8s_status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app-1")
+            assert job_metadata.status == "finished"
+            assert job_metadata.usage.cpu_seconds == 2.34 * 3600
+        assert prometheus_mock.get_cpu_usage.call_count == 1
+
+    def test_preload(self):
+        k8s_mock = KubernetesMock()
+        k8s_mock.submit(app_id="app-1", state=K8S_SPARK_APP_STATE.RUNNING)
+        k8s_mock.submit(app_id="app-2", state=K8S_SPARK_APP_STATE.RUNNING)
+        k8s_status_getter = K8sStatusGetter(k8s_mock, mock.Mock())
+
+        with mock.patch.object(
+            k8s_mock, "list_namespaced_custom_object", wraps=k8s_mock.list_namespaced_custom_object
+        ) as list_objects, mock.patch.object(
+            k8s_mock, "get_namespaced_custom_object", wraps=k8s_mock.get_namespaced_custom_object
+        ) as get_object:
+            k8s_status_getter.preload(app_ids=["app-1", "app-2"])
+            k8s_mock.apps["app-1"].set_completed()
+
+            # Preloaded objects are used once, after that the app is requested separately
+            assert k8s_status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app-1").status == "running"
+            assert get_object.call_count == 0
+            assert k8s_status_getter.get_job_metadata(job_id="j-1", user_id="john", app_id="app-1").status == "finished"
+            assert get_object.call_count == 1
+
+            assert k8s_status_getter.get_job_metadata(job_id="j-2", user_id="john", app_id="app-2").status == "running"
+            assert list_objects.call_count == 1
+            assert get_object.call_count == 1
+
 
 class TestCliApp:
     def test_run_basic_help(self, pytester):
@@ -1,4 +1,4 @@
-from kazoo.exceptions import NoNodeError, BadVersionError
+from kazoo.exceptions import NoNodeError, BadVersionError, RolledBackError
 import pytest
 
 from openeogeotrellis.config import get_backend_config, GpsBackendConfig
@@ -70,6 +70,34 @@ def test_kazoo_mock_children():
     assert client.get_children('/bar/fii') == []
 
 
+def test_kazoo_mock_async():
+    client = KazooClientMock()
+    client.create('/bar/baz', b'b6r', makepath=True)
+    assert client.get_async('/bar/baz').get() == (b'b6r', _ZNodeStat(1))
+    assert client.get_children_async('/bar').get() == ['baz']
+    result = client.get_async('/bar/nope')
+    with pytest.raises(NoNodeError):
+        result.get()
+
+
+def test_kazoo_mock_transaction():
+    client = KazooClientMock()
+    client.create('/foo/a', b'a', makepath=True)
+
+    transaction = client.transaction()
+    transaction.create('/foo/b', b'b')
+    transaction.delete('/foo/a', version=1)
+    assert transaction.commit() == [None, None]
+    assert client.get_children('/foo') == ['b']
+
+    transaction = client.transaction()
+    transaction.delete('/foo/b')
+    transaction.create('/bar/c', b'c')
+    results = transaction.commit()
+    assert [type(r) for r in results] == [RolledBackError, NoNodeError]
+    assert client.get_children('/foo') == ['b']
+
+
 class TestGpsConfigOverrides:
     def test_baseline(self):
         assert get_backend_config().id == "gps-test-dummy"
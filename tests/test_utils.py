@@ -2,6 +2,7 @@ import collections
 import datetime
 import getpass
 import logging
+import stat
 from pathlib import Path
 
 import pytest
@@ -20,6 +21,7 @@ from openeogeotrellis.utils import (
     StatsReporter,
     get_s3_binary_file_contents,
     to_s3_url, parse_approximate_isoduration, reproject_cellsize,
+    add_permissions,
 )
 
 
@@ -358,3 +360,35 @@ def test_parse_approximate_isoduration(duration_str, expected):
     duration = parse_approximate_isoduration(duration_str)
     print(f"duration={duration}")
     assert str(duration) == expected
+
+
+def test_add_permissions(tmp_path):
+    path = tmp_path / "file.txt"
+    path.touch(mode=0o600)
+    path.chmod(0o600)
+
+    add_permissions(path, stat.S_IWGRP)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o620
+
+    add_permissions(path, stat.S_IWGRP)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o620
+
+
+def test_add_permissions_str_path(tmp_path):
+    path = tmp_path / "file.txt"
+    path.touch()
+    path.chmod(0o600)
+
+    add_permissions(str(path), stat.S_IWGRP)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o620
+
+
+def test_add_permissions_missing_path_applies_to_siblings(tmp_path):
+    for name in ["a.txt", "b.txt"]:
+        (tmp_path / name).touch()
+        (tmp_path / name).chmod(0o600)
+
+    add_permissions(tmp_path / "missing.txt", stat.S_IWGRP)
+
+    assert stat.S_IMODE((tmp_path / "a.txt").stat().st_mode) == 0o620
+    assert stat.S_IMODE((tmp_path / "b.txt").stat().st_mode) == 0o620